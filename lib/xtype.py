@@ -21,6 +21,8 @@ Project: https://github.com/bitagoras/xtype-python
 
 __version__ = "0.5.1"
 
+import os
+import mmap
 import struct
 import numpy as np
 from typing import Any, Dict, List, Tuple, BinaryIO, Iterator, Optional, Union
@@ -66,8 +68,8 @@ class ContainerProxy:
 
         # Emit the opening token for the container immediately
         if opening_char:
-            self.xtFile.writer._buffer.append(opening_char)
-            self.xtFile.writer.flush()
+            self.xtFile.writer._buffer += opening_char
+            self.xtFile.writer._flush_if_full()
 
     # ------------------------------------------------------------------
     # Helper used by both ListProxy.add() and DictProxy.__setitem__()
@@ -79,17 +81,17 @@ class ContainerProxy:
             proxy = DictProxy(self.xtFile, parent=self)
             self.xtFile._open_containers.append(proxy)
             self.xtFile.last = proxy
-            self.xtFile.writer.flush()
+            self.xtFile.writer._flush_if_full()
             return proxy
         elif isinstance(value, list):
             proxy = ListProxy(self.xtFile, parent=self)
             self.xtFile._open_containers.append(proxy)
             self.xtFile.last = proxy
-            self.xtFile.writer.flush()
+            self.xtFile.writer._flush_if_full()
             return proxy
         else:
             self.xtFile.writer._write_object(value)
-            self.xtFile.writer.flush()
+            self.xtFile.writer._flush_if_full()
             self.xtFile.last = self
             return None
 
@@ -100,8 +102,8 @@ class ContainerProxy:
     def _close(self):
         """Write the container's closing token if not already closed."""
         if not self._closed:
-            self.xtFile.writer._buffer.append(self._closing_char)
-            self.xtFile.writer.flush()
+            self.xtFile.writer._buffer += self._closing_char
+            self.xtFile.writer._flush_if_full()
             self._closed = True
 
 class ListProxy(ContainerProxy):
@@ -236,6 +238,10 @@ class File:
         if self.file is None and not self._was_closed:
             self._open()
         if self.file:
+            if self.writer is not None:
+                self.writer.flush()
+            if self.reader is not None:
+                self.reader.close()
             self.file.close()
             self.file = None
             self._was_closed = True
@@ -293,8 +299,14 @@ class File:
                  list, dict, or numpy array)
         """
         self._check_open_for_writing()
-        self.writer._write_bom()
-        self.writer._write_object(data)
+        staged = len(self.writer._buffer)
+        try:
+            self.writer._write_bom()
+            self.writer._write_object(data)
+        except Exception:
+            # Discard the partial output of an object that cannot be written
+            del self.writer._buffer[staged:]
+            raise
         self.writer.flush()
         # If any containers were open, close them
         # self._close_open_containers()
@@ -449,6 +461,39 @@ class XTypeFileWriter:
         np.dtype('float64'): 'd'  # 64-bit double-precision float
     }
 
+    # struct format characters of the integer type codes
+    int_formats = {
+        'I': 'B', 'J': 'H', 'K': 'I', 'L': 'Q',  # unsigned
+        'i': 'b', 'j': 'h', 'k': 'i', 'l': 'q'   # signed
+    }
+
+    # struct format characters of all scalar type codes
+    scalar_formats = dict(int_formats, b='?', h='e', f='f', d='d')
+
+    # struct format characters of the length markers
+    length_formats = {'M': 'B', 'N': 'H', 'O': 'I', 'P': 'Q'}
+
+    # Length markers indexed by bit_length() of lengths larger than 9
+    _length_markers = ('M',) * 9 + ('N',) * 8 + ('O',) * 16 + ('P',) * 32
+
+    # Smallest integer type codes indexed by bit_length() of the value (for
+    # non-negative values) or of ~value (for negative values)
+    _uint_codes = ('I',) * 9 + ('J',) * 8 + ('K',) * 16 + ('L',) * 32
+    _int_codes = ('i',) * 8 + ('j',) * 8 + ('k',) * 16 + ('l',) * 32
+
+    # NumPy scalar types with a direct type code mapping
+    _np_scalar_types = (np.bool_, np.byte, np.ubyte, np.short, np.ushort, np.intc, np.uintc,
+                        np.int_, np.uint, np.longlong, np.ulonglong, np.half, np.single, np.double)
+
+    # Size of the staging buffer in bytes at which it is written to the file
+    _BUF_LIMIT = 1 << 20
+
+    # Minimum number of list items for which vectorized writing is used
+    _VECTORIZE_MIN = 32
+
+    # Maximum number of encoded dictionary keys kept in the key cache
+    _KEY_CACHE_SIZE = 4096
+
     def __init__(self, xtFile: File, byteorder: str = 'auto'):
         """
         Initialize an XTypeFileWriter object.
@@ -460,15 +505,119 @@ class XTypeFileWriter:
         self.byteorder = byteorder if byteorder != 'auto' else sys.byteorder
         self.need_byteswap = self.byteorder != sys.byteorder
         self.struct_byteorder = {'little': '<', 'big': '>'}[self.byteorder]
-        self._buffer = []  # Buffer for binary fragments
+        self._buffer = bytearray()  # Staging buffer for binary fragments
+        self._key_cache = {}  # Encoded string elements of dictionary keys
+        # File descriptor for gather writes of the staging buffer and large
+        # payloads. Only used for write-only files, which have no read-ahead
+        # that could make the descriptor position differ from the file position
+        self._gather_fd = self.file.fileno() if hasattr(os, 'writev') and not self.file.readable() else None
+
+        # Precompiled struct objects that pack the type code (or length marker)
+        # byte together with the value, so each element is a single append
+        self._typed_int_packers = {code: (struct.Struct(self.struct_byteorder + 'c' + fmt), code.encode())
+                                   for code, fmt in self.int_formats.items()}
+        self._float_packer = struct.Struct(self.struct_byteorder + 'cd')
+        # Footnote with the 16-bit signed integer 1234 that marks the byte order
+        self._bom_bytes = b'*' + self._typed_int_packers['j'][0].pack(b'j', 1234)
+        # Packers for NumPy scalars by dtype number, including aliases such as
+        # longlong/int64 that have distinct numbers but the same type code
+        self._np_scalar_packers = {}
+        # Type codes of NumPy array dtypes by dtype number, including aliases
+        self._array_type_codes = {}
+        for scalar_type in self._np_scalar_types:
+            dtype = np.dtype(scalar_type)
+            type_code = self.type_map.get(dtype)
+            if type_code is not None:
+                self._array_type_codes[dtype.num] = type_code.encode()
+                fmt = self.scalar_formats[type_code]
+                self._np_scalar_packers[dtype.num] = (struct.Struct(self.struct_byteorder + 'c' + fmt),
+                                                      type_code.encode())
+
+        # Write handlers by exact object type. Subclasses of these types are
+        # handled by the isinstance() checks in _write_object and _write_element
+        self._obj_dispatch = {
+            list: self._write_list,
+            tuple: self._write_list,
+            dict: self._write_dict,
+            np.ndarray: self._write_numpy_array,
+            type(None): self._write_none,
+            bool: self._write_bool,
+            int: self._write_int,
+            float: self._write_float,
+            str: self._write_str,
+            bytes: self._write_bytes,
+        }
+        for scalar_type in self._np_scalar_types:
+            self._obj_dispatch[scalar_type] = self._write_np_scalar
+        self._len_packers = {marker: struct.Struct(self.struct_byteorder + 'c' + fmt)
+                             for marker, fmt in self.length_formats.items()}
+        # Packer and marker byte of lengths indexed by their bit_length()
+        self._len_tiers = [(self._len_packers[marker], marker.encode())
+                           for marker in self._length_markers]
+        # Single-digit lengths as ASCII characters '0' through '9'
+        self._digit_bytes = [str(i).encode() for i in range(10)]
+        # Length and type code prefixes of string elements with up to 255 bytes
+        self._short_str_prefixes = [self._encode_length(length) + b's' for length in range(256)]
 
     def flush(self):
         """
-        Write all buffered binary fragments to the file and clear the buffer.
+        Write the staging buffer to the file and clear it.
+        """
+        if self._buffer:
+            self.file.write(self._buffer)
+            self._buffer.clear()
+
+    def _flush_if_full(self):
+        """
+        Flush the staging buffer once it has grown beyond _BUF_LIMIT.
+        """
+        if len(self._buffer) >= self._BUF_LIMIT:
+            self.flush()
+
+    def _write_data(self, data):
         """
-        for frag in self._buffer:
-            self.file.write(frag)
-        self._buffer.clear()
+        Write a binary payload.
+
+        Small payloads are appended to the staging buffer. Payloads of at least
+        _BUF_LIMIT bytes are written directly to the file together with the
+        staged bytes, so they are not copied into the staging buffer first.
+
+        Args:
+            data: A bytes-like object with the binary payload
+        """
+        if len(data) >= self._BUF_LIMIT:
+            if self._gather_fd is not None and self._buffer:
+                self._write_gather(self._buffer, data)
+                self._buffer.clear()
+            else:
+                self.flush()
+                self.file.write(data)
+        else:
+            self._buffer += data
+
+    def _write_gather(self, *chunks):
+        """
+        Write several bytes-like objects with os.writev().
+
+        The staged headers and a large payload are passed to the kernel in one
+        system call, instead of one write per fragment. Partial writes are
+        continued until all data is written.
+
+        Args:
+            *chunks: Bytes-like objects with one byte per item
+        """
+        self.file.flush()
+        views = [memoryview(chunk) for chunk in chunks]
+        try:
+            while views:
+                written = os.writev(self._gather_fd, views)
+                while views and written >= len(views[0]):
+                    written -= len(views.pop(0))
+                if written:
+                    views[0] = views[0][written:]
+        finally:
+            # Release the exports so that the staging buffer can be resized again
+            del views
 
     def _write_bom(self):
         """
@@ -482,8 +631,7 @@ class XTypeFileWriter:
         -11772. If no such file signature is given, xtype is specified for big endian byte order as
         default.
         """
-        self._buffer.append(b'*j')
-        self._write_int_value(1234, 'j')
+        self._buffer += self._bom_bytes
 
     def _write_object(self, obj: Any):
         """
@@ -492,19 +640,15 @@ class XTypeFileWriter:
         Args:
             obj: The object to write
         """
-        if isinstance(obj, (list, tuple)):
+        handler = self._obj_dispatch.get(type(obj))
+        if handler is not None:
+            handler(obj)
+        elif isinstance(obj, (list, tuple)):
             self._write_list(obj)
         elif isinstance(obj, dict):
             self._write_dict(obj)
         elif isinstance(obj, np.ndarray):
             self._write_numpy_array(obj)
-        elif isinstance(obj, bytes):
-            # Handle bytes directly instead of treating as an element
-            # This is important for binary data handling
-            self._write_element(obj)
-        elif obj is None:
-            # Handle None explicitly
-            self._buffer.append(b'n')
         else:
             self._write_element(obj)
 
@@ -515,10 +659,93 @@ class XTypeFileWriter:
         Args:
             lst: The list to write
         """
-        self._buffer.append(b'[')
+        self._buffer += b'['
+        item_types = set(map(type, lst))
+        if len(item_types) == 1:
+            # Homogeneous list: look up the write handler only once
+            item_type = item_types.pop()
+            if item_type is int and len(lst) >= self._VECTORIZE_MIN and self._write_int_items(lst):
+                self._buffer += b']'
+                return
+            if item_type is float and len(lst) >= self._VECTORIZE_MIN:
+                self._write_float_items(lst)
+                self._buffer += b']'
+                return
+            write_item = self._obj_dispatch.get(item_type, self._write_object)
+        else:
+            write_item = self._write_object
+        buffer = self._buffer
+        limit = self._BUF_LIMIT
         for item in lst:
-            self._write_object(item)
-        self._buffer.append(b']')
+            write_item(item)
+            if len(buffer) >= limit:
+                self.flush()
+        buffer += b']'
+
+    def _write_int_items(self, lst: List[int]) -> bool:
+        """
+        Write a sequence of Python ints as consecutive integer elements.
+
+        Produces the same bytes as writing each value with _write_element, but
+        selects the type codes and packs the values with vectorized NumPy
+        operations: each value is stored as a 9-byte record of type code and
+        64-bit value, from which the unused high-order bytes are masked out.
+
+        Args:
+            lst: The integers to write
+
+        Returns:
+            bool: False if the values do not fit into 64-bit integers, in which
+                  case nothing was written
+        """
+        arr = np.array(lst)
+        if arr.dtype.kind == 'i':
+            arr = arr.astype(np.int64, copy=False)
+            negative = arr < 0
+            # 0, 1, 2 or 3 for 8, 16, 32 and 64 bit values
+            level = np.where(negative,
+                             (arr < -0x80).view(np.uint8) + (arr < -0x8000) + (arr < -0x80000000),
+                             (arr > 0xFF).view(np.uint8) + (arr > 0xFFFF) + (arr > 0xFFFFFFFF))
+            level = level.astype(np.uint8) + np.where(negative, 0, 4).astype(np.uint8)
+        elif arr.dtype.kind == 'u':
+            arr = arr.astype(np.uint64, copy=False)
+            level = (arr > 0xFF).view(np.uint8) + (arr > 0xFFFF) + (arr > 0xFFFFFFFF) + np.uint8(4)
+            level = level.astype(np.uint8)
+        else:
+            return False
+
+        n = len(arr)
+        records = np.empty((n, 9), dtype=np.uint8)
+        records[:, 0] = np.frombuffer(b'ijklIJKL', dtype=np.uint8)[level]
+        records[:, 1:] = arr.astype(arr.dtype.newbyteorder(self.struct_byteorder)).view(np.uint8).reshape(n, 8)
+
+        # Keep the type code and the value bytes within the selected width
+        width = np.left_shift(1, level & 3)
+        keep = np.empty((n, 9), dtype=bool)
+        keep[:, 0] = True
+        if self.byteorder == 'little':
+            keep[:, 1:] = np.arange(8) < width[:, None]
+        else:
+            keep[:, 1:] = np.arange(8) >= 8 - width[:, None]
+
+        self._write_array_data(records[keep])
+        return True
+
+    def _write_float_items(self, lst: List[float]):
+        """
+        Write a sequence of Python floats as consecutive 64-bit float elements.
+
+        Produces the same bytes as writing each value with _write_float, with
+        the 9-byte records of type code and value built by NumPy.
+
+        Args:
+            lst: The floats to write
+        """
+        n = len(lst)
+        records = np.empty((n, 9), dtype=np.uint8)
+        records[:, 0] = ord('d')
+        records[:, 1:] = np.array(lst, dtype=self.struct_byteorder + 'f8').view(np.uint8).reshape(n, 8)
+        self._write_array_data(records)
 
     def _write_dict(self, d: Dict):
         """
@@ -527,16 +754,52 @@ class XTypeFileWriter:
         Args:
             d: The dictionary to write
         """
-        self._buffer.append(b'{')
+        buffer = self._buffer
+        buffer += b'{'
+        # Bound methods and the dispatch lookup are fetched once per dictionary
+        write_key = self._write_key
+        get_handler = self._obj_dispatch.get
+        write_object = self._write_object
+        limit = self._BUF_LIMIT
         for key, value in d.items():
             # Convert key to string if it's not already
             if not isinstance(key, str):
                 key = str(key)
             # Write the key as a string element
-            self._write_element(key)
-            # Write the value
-            self._write_object(value)
-        self._buffer.append(b'}')
+            write_key(key)
+            # Write the value with the handler of its exact type
+            get_handler(type(value), write_object)(value)
+            if len(buffer) >= limit:
+                self.flush()
+        buffer += b'}'
+
+    def _write_key(self, key: str):
+        """
+        Write a dictionary key as a string element.
+
+        The complete element of keys with up to 255 bytes is cached and written
+        with a single append, so repeated keys are neither encoded nor
+        length-packed again.
+
+        Args:
+            key: The key to write
+        """
+        element = self._key_cache.get(key)
+        if element is not None:
+            self._buffer += element
+            return
+        encoded = key.encode('utf-8')
+        length = len(encoded)
+        if length <= 0xFF:
+            element = self._short_str_prefixes[length] + encoded
+            if len(self._key_cache) >= self._KEY_CACHE_SIZE:
+                self._key_cache.clear()
+            self._key_cache[key] = element
+            self._buffer += element
+            return
+        self._write_length(length)
+        self._buffer += b's'
+        self._write_data(encoded)
 
     def _write_element(self, value: Any):
         """
@@ -546,63 +809,76 @@ class XTypeFileWriter:
             value: The value to write
         """
         if value is None:
-            self._buffer.append(b'n')
+            self._write_none(value)
         elif isinstance(value, bool):
-            self._buffer.append(b'T' if value else b'F')
+            self._write_bool(value)
         elif isinstance(value, int):
-            type_code = self._select_int_type(value)
-            self._buffer.append(type_code.encode())
-            self._write_int_value(value, type_code)
+            self._write_int(value)
         elif isinstance(value, float):
-            self._buffer.append(b'd')
-            self._buffer.append(struct.pack(f'{self.struct_byteorder}d', value))
+            self._write_float(value)
         elif isinstance(value, str):
-            # Write string with length prefix
-            encoded = value.encode('utf-8')
-            self._write_length(len(encoded))
-            self._buffer.append(b's')
-            self._buffer.append(encoded)
+            self._write_str(value)
         elif isinstance(value, bytes):
-            # Write bytes with length prefix
-            self._write_length(len(value))
-            self._buffer.append(b'x')
-            self._buffer.append(value)
+            self._write_bytes(value)
         elif isinstance(value, np.number) or isinstance(value, np.bool_):
-            # Handle NumPy scalar types
-            dtype = value.dtype
-            if dtype in self.type_map:
-                type_code = self.type_map[dtype]
-                self._buffer.append(type_code.encode())
-
-                # Process based on the specific scalar type
-                if np.issubdtype(dtype, np.integer):
-                    # Handle integer types
-                    if np.issubdtype(dtype, np.integer):
-                        data = np.asarray(value, dtype=dtype)
-                        # Only need to byteswap for multi-byte integers (16, 32, 64 bit)
-                        if self.need_byteswap and type_code not in ('i', 'I'):
-                            data = data.byteswap()
-                        self._buffer.append(data.tobytes())
-                elif np.issubdtype(dtype, np.bool_):
-                    # Handle boolean type
-                    if type_code == 'b':
-                        # boolean
-                        self._buffer.append(np.asarray(value, dtype=np.bool_).tobytes())
-                elif np.issubdtype(dtype, np.floating):
-                    # Handle floating point types
-                    if type_code in ('h', 'f', 'd'):
-                        # Map type codes to numpy dtypes
-                        dtype_map = {'h': np.float16, 'f': np.float32, 'd': np.float64}
-                        data = np.asarray(value, dtype=dtype_map[type_code])
-                        if self.need_byteswap:
-                            data = data.byteswap()
-                        self._buffer.append(data.tobytes())
-            else:
-                # Default fallback for unsupported NumPy scalar types: convert to Python scalar
-                self._write_element(value.item())
+            self._write_np_scalar(value)
         else:
             raise TypeError(f"Unsupported type: {type(value)}")
 
+    def _write_none(self, value: None):
+        """Write None."""
+        self._buffer += b'n'
+
+    def _write_bool(self, value: bool):
+        """Write a boolean as 'T' or 'F'."""
+        self._buffer += b'T' if value else b'F'
+
+    def _write_int(self, value: int):
+        """Write an integer with the smallest fitting type code."""
+        packer, type_code = self._typed_int_packers[self._select_int_type(value)]
+        self._buffer += packer.pack(type_code, value)
+
+    def _write_float(self, value: float):
+        """Write a float as 64-bit double."""
+        self._buffer += self._float_packer.pack(b'd', value)
+
+    def _write_str(self, value: str):
+        """Write a string with length prefix."""
+        encoded = value.encode('utf-8')
+        length = len(encoded)
+        if length <= 0xFF:
+            # Short strings are staged with their precomputed prefix
+            buffer = self._buffer
+            buffer += self._short_str_prefixes[length]
+            buffer += encoded
+            return
+        if length < self._BUF_LIMIT:
+            # Medium strings are staged directly, without the checks of _write_data
+            buffer = self._buffer
+            buffer += self._encode_length(length)
+            buffer += b's'
+            buffer += encoded
+            return
+        self._write_length(length)
+        self._buffer += b's'
+        self._write_data(encoded)
+
+    def _write_bytes(self, value: bytes):
+        """Write bytes with length prefix."""
+        self._write_length(len(value))
+        self._buffer += b'x'
+        self._write_data(value)
+
+    def _write_np_scalar(self, value: Union[np.number, np.bool_]):
+        """Write a NumPy scalar with the type code of its dtype."""
+        entry = self._np_scalar_packers.get(value.dtype.num)
+        if entry is not None:
+            packer, type_code = entry
+            self._buffer += packer.pack(type_code, value.item())
+        else:
+            # Default fallback for unsupported NumPy scalar types: convert to Python scalar
+            self._write_element(value.item())
+
     def _write_numpy_array(self, arr: np.ndarray):
         """
         Write a NumPy array to the file.
@@ -611,8 +887,10 @@ class XTypeFileWriter:
         Special handling is provided for string arrays, where an additional dimension
         is added to represent the string length for multi-dimensional string arrays.
 
-        The array is automatically converted to C-contiguous order if needed,
-        and byte swapping is performed if the system's endianness differs from the file's.
+        The data is always written in C order. Arrays in other memory layouts, such
+        as F-contiguous arrays, are reordered block by block while writing, without
+        a full C-contiguous copy. Byte swapping is performed the same way if the
+        system's endianness differs from the file's.
 
         Args:
             arr: The NumPy array to write with any supported dtype
@@ -620,10 +898,6 @@ class XTypeFileWriter:
         Raises:
             TypeError: If the array has an unsupported dtype
         """
-        # Handle array shape
-        for dim in arr.shape:
-            self._write_length(dim)
-
         # Get the type code for the array's data type
         dtype = arr.dtype
 
@@ -632,57 +906,72 @@ class XTypeFileWriter:
             # For string arrays, we need to also write the string length dimension
             # Extract the itemsize which represents the max string length
             str_length = dtype.itemsize
-            self._write_length(str_length)
+            self._write_shape(arr.shape + (str_length,))
 
             # For string arrays, use 's' type code
-            self._buffer.append(b's')
-
-            # Ensure the array is in C-contiguous order for efficient serialization
-            if not arr.flags.c_contiguous:
-                arr = np.ascontiguousarray(arr)
+            self._buffer += b's'
 
             # Write the entire array memory to the file
-            self._buffer.append(arr.tobytes())
+            self._write_array_data(arr)
 
             return
 
-        if dtype not in self.type_map:
+        type_code = self._array_type_codes.get(dtype.num)
+        if type_code is None:
             raise TypeError(f"Unsupported NumPy dtype: {dtype}")
 
-        type_code = self.type_map[dtype]
-        self._buffer.append(type_code.encode())
+        self._write_shape(arr.shape)
+        self._buffer += type_code
 
-        # Ensure the array is in C-contiguous order for efficient serialization
-        if not arr.flags.c_contiguous:
-            arr = np.ascontiguousarray(arr)
-
-        if self.need_byteswap:
-            tobytes = lambda x: x.byteswap().tobytes()
+        # Write the array data based on its type
+        if type_code == b'b':
+            # Convert boolean array to bytes (0x00 for False, 0xFF for True).
+            # Negating the bytes 0x00/0x01 as uint8 yields 0x00/0xFF in one pass
+            for block in self._iter_array_blocks(arr.view(np.uint8), np.dtype(np.uint8)):
+                self._write_data(memoryview(np.negative(block)))
+                self._flush_if_full()
         else:
-            tobytes = lambda x: x.tobytes()
+            # Integer and floating point types. The dtype number does not include
+            # the byte order, so arrays in non-native byte order are accepted too.
+            # They need a swap exactly when the file has the native byte order
+            self._write_array_data(arr, dtype.itemsize > 1 and dtype.isnative == self.need_byteswap)
 
-        # Write the array data based on its type
-        if dtype == np.dtype('bool'):
-            # Convert boolean array to bytes (0x00 for False, 0xFF for True)
-            self._buffer.append(np.where(arr, 0xFF, 0x00).astype(np.uint8).tobytes())
-        elif np.issubdtype(dtype, np.integer):
-            # Handle integer types
-            if type_code in ('i', 'I'):  # uint8, int8
-                self._buffer.append(arr.tobytes())
-            elif type_code in ('j', 'J'):  # uint16, int16
-                self._buffer.append(tobytes(arr.astype(dtype)))
-            elif type_code in ('k', 'K'):  # uint32, int32
-                self._buffer.append(tobytes(arr.astype(dtype)))
-            elif type_code in ('l', 'L'):  # uint64, int64
-                self._buffer.append(tobytes(arr.astype(dtype)))
-        elif np.issubdtype(dtype, np.floating):
-            # Handle floating point types
-            if type_code == 'h':  # float16
-                self._buffer.append(tobytes(arr.astype(np.float16)))
-            elif type_code == 'f':  # float32
-                self._buffer.append(tobytes(arr.astype(np.float32)))
-            elif type_code == 'd':  # float64
-                self._buffer.append(tobytes(arr.astype(np.float64)))
+    def _write_array_data(self, arr: np.ndarray, byteswap: bool = False):
+        """
+        Write the memory of an array in C order.
+
+        The memory of a C-contiguous array is passed on as a memoryview, so no
+        copy of the data is made. Arrays that are not C-contiguous or need a
+        byte swap are converted in blocks of at most _BUF_LIMIT bytes, so large
+        arrays never need a temporary copy of their full size.
+
+        Args:
+            arr: The array to write
+            byteswap: Swap the byte order of the elements before writing
+        """
+        if arr.flags.c_contiguous and not byteswap:
+            self._write_data(memoryview(arr.reshape(-1).view(np.uint8)))
+            return
+        dtype = arr.dtype.newbyteorder() if byteswap else arr.dtype
+        for block in self._iter_array_blocks(arr, dtype):
+            self._write_data(memoryview(np.ascontiguousarray(block).view(np.uint8)))
+            self._flush_if_full()
+
+    def _iter_array_blocks(self, arr: np.ndarray, dtype: np.dtype) -> Iterator[np.ndarray]:
+        """
+        Iterate over the elements of an array in C order in blocks.
+
+        Args:
+            arr: The array to iterate over
+            dtype: The dtype the elements are cast to, e.g. with swapped byte order
+
+        Returns:
+            Iterator over 1-D arrays with at most _BUF_LIMIT bytes each. Blocks
+            that need no cast may be strided views into the array.
+        """
+        block_size = max(1, self._BUF_LIMIT // max(1, dtype.itemsize))
+        return np.nditer(arr, flags=['external_loop', 'buffered', 'zerosize_ok'],
+                         op_dtypes=[dtype], casting='unsafe', order='C', buffersize=block_size)
 
     def _select_int_type(self, value: int) -> str:
         """
@@ -695,66 +984,51 @@ class XTypeFileWriter:
             The xtype type code
         """
         if value >= 0:
-            if value <= 0xFF:
-                return 'I'  # uint8
-            elif value <= 0xFFFF:
-                return 'J'  # uint16
-            elif value <= 0xFFFFFFFF:
-                return 'K'  # uint32
-            else:
-                return 'L'  # uint64
+            bits = value.bit_length()
+            return self._uint_codes[bits] if bits < 65 else 'L'
         else:
-            if value >= -0x80 and value <= 0x7F:
-                return 'i'  # int8
-            elif value >= -0x8000 and value <= 0x7FFF:
-                return 'j'  # int16
-            elif value >= -0x80000000 and value <= 0x7FFFFFFF:
-                return 'k'  # int32
-            else:
-                return 'l'  # int64
+            bits = (~value).bit_length()
+            return self._int_codes[bits] if bits < 64 else 'l'
 
-    def _write_int_value(self, value: int, type_code: str):
+    def _write_length(self, length: int):
         """
-        Write an integer value with the specified type code.
+        Write a length value using the appropriate format.
 
         Args:
-            value: The integer value
-            type_code: The xtype type code
+            length: The length to write
         """
-        type_format = {
-            'I': 'B', 'J': 'H', 'K': 'I', 'L': 'Q',  # unsigned
-            'i': 'b', 'j': 'h', 'k': 'i', 'l': 'q'   # signed
-        }
-        format_char = type_format.get(type_code)
-        if format_char:
-            self._buffer.append(struct.pack(f'{self.struct_byteorder}{format_char}', value))
+        self._buffer += self._encode_length(length)
 
-    def _write_length(self, length: int):
+    def _write_shape(self, shape: Tuple[int, ...]):
         """
-        Write a length value using the appropriate format.
+        Write the dimensions of an array as consecutive length values.
+
+        All dimensions are encoded first and appended to the buffer at once.
 
         Args:
-            length: The length to write
+            shape: The dimensions to write
+        """
+        if len(shape) == 1:
+            self._buffer += self._encode_length(shape[0])
+        else:
+            self._buffer += b''.join([self._encode_length(dim) for dim in shape])
+
+    def _encode_length(self, length: int) -> bytes:
+        """
+        Encode a length value using the appropriate format.
+
+        Args:
+            length: The length to encode
+
+        Returns:
+            bytes: The encoded length with its marker
         """
         if length <= 9:
             # Single-digit lengths are written as ASCII characters '0' through '9'
-            self._buffer.append(str(length).encode())
-        elif length <= 0xFF:
-            # uint8 length
-            self._buffer.append(b'M')
-            self._buffer.append(struct.pack(f'{self.struct_byteorder}B', length))
-        elif length <= 0xFFFF:
-            # uint16 length
-            self._buffer.append(b'N')
-            self._buffer.append(struct.pack(f'{self.struct_byteorder}H', length))
-        elif length <= 0xFFFFFFFF:
-            # uint32 length
-            self._buffer.append(b'O')
-            self._buffer.append(struct.pack(f'{self.struct_byteorder}I', length))
-        else:
-            # uint64 length
-            self._buffer.append(b'P')
-            self._buffer.append(struct.pack(f'{self.struct_byteorder}Q', length))
+            return self._digit_bytes[length]
+        # uint8, uint16, uint32 or uint64 length with marker M, N, O or P
+        packer, marker = self._len_tiers[length.bit_length()]
+        return packer.pack(marker, length)
 
 
 class XTypeFileReader:
@@ -799,6 +1073,18 @@ class XTypeFileReader:
         'd': np.float64    # 64-bit double-precision float
     }
 
+    # Number of bytes read ahead into the buffer when parsing the grammar
+    _READ_AHEAD = 1 << 13
+
+    # Kinds of grammar bytes in the parse action table
+    _GRAMMAR, _DIGIT, _LENGTH, _TYPE = range(4)
+
+    # Result of _read_fast() if the element needs the generic path
+    _NOT_FAST = object()
+
+    # Parse tables by struct byte order, built by _parse_tables()
+    _parse_tables_by_byteorder = {}
+
     def __init__(self, xtFile: File, byteorder: str = 'auto'):
         """
         Initialize an XTypeFileReader object.
@@ -812,6 +1098,15 @@ class XTypeFileReader:
         self._pending_binary_type = None
         self.need_byteswap = False
 
+        # Read-ahead buffer: the bytes of the file starting at _buf_start, and
+        # the read position within them. The logical file position is
+        # _buf_start + _buf_pos, the position of self.file is not used
+        self._buf = b''
+        self._buf_start = 0
+        self._buf_pos = 0
+        self._mmap = None  # Memory map of the whole file in read mode
+        self._read_ahead = bytearray(self._READ_AHEAD)  # Reused by _fill_buffer()
+
         if byteorder == 'auto':
             # Read BOM to detect byte order automatically
             self._read_bom()
@@ -823,6 +1118,93 @@ class XTypeFileReader:
             self.byteorder = byteorder
         self.struct_byteorder = {'little': '<', 'big': '>'}[self.byteorder]
 
+        # Parse tables of the byte order, shared by all readers
+        self._byte_actions, self._scalar_unpackers, self._fast_actions = \
+            self._parse_tables(self.struct_byteorder)
+
+        # Readers of the grammar symbols that start an element
+        self._symbol_readers = {
+            '[': self._read_list,
+            '{': self._read_dict,
+            'T': lambda: True,
+            'F': lambda: False,
+            'n': lambda: None,
+        }
+
+        # Files opened for reading only are mapped into memory. The map then serves
+        # as read-ahead buffer for the whole file, so no read calls are needed
+        if xtFile.mode == 'r':
+            try:
+                self._mmap = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                # Files that cannot be mapped are read through the file object
+                pass
+            else:
+                pos = self._getPos()
+                self._buf = self._mmap
+                self._buf_start = 0
+                self._buf_pos = pos
+
+    @classmethod
+    def _parse_tables(cls, struct_byteorder: str) -> Tuple[List, Dict[str, struct.Struct], List]:
+        """
+        Get the parse tables of a byte order, which are built on first use.
+
+        Args:
+            struct_byteorder: The struct byte order character, '<' or '>'
+
+        Returns:
+            Tuple[List, Dict[str, struct.Struct], List]: A tuple containing:
+                - byte_actions: Parse action by byte value of the grammar, a tuple
+                  (kind, symbol, value) with the digit value, the precompiled struct
+                  object of a length marker or the element size of a type. None for
+                  bytes that are not allowed
+                - scalar_unpackers: Precompiled struct objects of the scalar types
+                - fast_actions: Action by byte value for elements that _read_fast()
+                  reads directly, a tuple (kind, value) with the value of constants
+                  and closing symbols, the struct object of scalars or the value of
+                  length digits
+        """
+        tables = cls._parse_tables_by_byteorder.get(struct_byteorder)
+        if tables is not None:
+            return tables
+
+        byte_actions = [None] * 256
+        for char in '[]{}TFn*':
+            byte_actions[ord(char)] = (cls._GRAMMAR, char, 0)
+        for digit in range(10):
+            byte_actions[ord('0') + digit] = (cls._DIGIT, str(digit), digit)
+        for marker, fmt in XTypeFileWriter.length_formats.items():
+            byte_actions[ord(marker)] = (cls._LENGTH, marker, struct.Struct(struct_byteorder + fmt))
+        for type_code, type_size in cls.type_sizes.items():
+            byte_actions[ord(type_code)] = (cls._TYPE, type_code, type_size)
+
+        scalar_unpackers = {type_code: struct.Struct(struct_byteorder + fmt)
+                            for type_code, fmt in XTypeFileWriter.scalar_formats.items()}
+
+        fast_actions = [None] * 256
+        for char, value in (('T', True), ('F', False), ('n', None), (']', (']',)), ('}', ('}',))):
+            fast_actions[ord(char)] = (cls._GRAMMAR, value)
+        for type_code, unpacker in scalar_unpackers.items():
+            fast_actions[ord(type_code)] = (cls._TYPE, unpacker)
+        for digit in range(10):
+            fast_actions[ord('0') + digit] = (cls._DIGIT, digit)
+
+        tables = (byte_actions, scalar_unpackers, fast_actions)
+        cls._parse_tables_by_byteorder[struct_byteorder] = tables
+        return tables
+
+    def close(self):
+        """
+        Release the memory map of the file, if any.
+        """
+        if self._mmap is not None:
+            self._buf = b''
+            self._buf_start = 0
+            self._buf_pos = 0
+            self._mmap.close()
+            self._mmap = None
+
     def _setPos(self, pos: int):
         """
         Set the file position to the given value.
@@ -833,7 +1215,14 @@ class XTypeFileReader:
         Args:
             pos: File position to seek to
         """
-        self.file.seek(pos)
+        offset = pos - self._buf_start
+        if 0 <= offset <= len(self._buf):
+            # The position is within the read-ahead buffer
+            self._buf_pos = offset
+        else:
+            self._buf = b''
+            self._buf_start = pos
+            self._buf_pos = 0
         self._pending_binary_size = 0
 
     def _getPos(self, withPendingBinary:bool = False) -> int:
@@ -845,7 +1234,7 @@ class XTypeFileReader:
         Returns:
             int: The current file position
         """
-        pos = self.file.tell()
+        pos = self._buf_start + self._buf_pos
         if withPendingBinary:
             nRest = self._pending_binary_size
             if nRest:
@@ -869,8 +1258,7 @@ class XTypeFileReader:
             raise IOError("File is not open for reading")
 
         # Reset the file position to the beginning
-        self.file.seek(pos)
-        self._pending_binary_size = 0
+        self._setPos(pos)
 
         # Start recursive parsing
         data = self._read_object()
@@ -909,6 +1297,8 @@ class XTypeFileReader:
 
         # Initialize internal state
         indent_level = 0
+        # Indentation strings for each indentation level
+        indents = [' ' * (i * indent_size) for i in range(max_indent_level + 1)]
         # Collecting characters that don't have binary data
         accumulated_strings = []
         # Track array shape to detect multidimensional arrays
@@ -924,7 +1314,7 @@ class XTypeFileReader:
                     if accumulated_strings:
                         # Join all accumulated strings without spaces and wrap in a single pair of quotes
                         accumulated_str = "".join(accumulated_strings)
-                        yield ' ' * min(indent_level, max_indent_level) * indent_size + f'{accumulated_str}'
+                        yield indents[min(indent_level, max_indent_level)] + accumulated_str
                         accumulated_strings = []
 
                     # For closing brackets, decrease indentation before printing
@@ -938,7 +1328,7 @@ class XTypeFileReader:
                                 in_array_context = False
 
                     # Print the bracket on its own line with proper indentation
-                    yield ' ' * min(indent_level, max_indent_level) * indent_size + f'{symbol}'
+                    yield indents[min(indent_level, max_indent_level)] + symbol
 
                     # For opening brackets, increase indentation after printing
                     if symbol in '[{':
@@ -962,13 +1352,17 @@ class XTypeFileReader:
                     continue
 
                 # If we get here, it's a data type with binary data (flag == 2)
-                current_indent = ' ' * min(indent_level, max_indent_level) * indent_size
+                current_indent = indents[min(indent_level, max_indent_level)]
 
                 # Include accumulated strings if any
                 if accumulated_strings:
-                    # Join all accumulated strings without spaces and add the current symbol
-                    accumulated_str = "".join(accumulated_strings) + symbol
-                    accumulated_strings = []
+                    # Join all accumulated strings without spaces and add the current symbol.
+                    # Usually there is a single length digit, which is just concatenated
+                    if len(accumulated_strings) == 1:
+                        accumulated_str = accumulated_strings[0] + symbol
+                    else:
+                        accumulated_str = "".join(accumulated_strings) + symbol
+                    accumulated_strings.clear()
                 else:
                     accumulated_str = symbol
 
@@ -985,34 +1379,34 @@ class XTypeFileReader:
                         string_value = binary_part.decode('utf-8', errors='replace')
                         if is_multidimensional:
                             # Treat like any other non-string array - show as hex
-                            hex_str = ' '.join(f'{b:02x}' for b in binary_part)
+                            hex_str = binary_part.hex(' ')
                             if len(binary_part) < length_or_size:
                                 hex_str += f" ... ({length_or_size} bytes total)"
-                            yield current_indent + f'{accumulated_str}: {hex_str}'
+                            yield f'{current_indent}{accumulated_str}: {hex_str}'
                         else:
                             # Regular string display with quotation marks
-                            yield current_indent + f'{accumulated_str}: "{string_value}"'
+                            yield f'{current_indent}{accumulated_str}: "{string_value}"'
                     except Exception:
                         # If decoding fails, fall back to hex representation
-                        hex_str = ' '.join(f'{b:02x}' for b in binary_part)
+                        hex_str = binary_part.hex(' ')
                         if len(binary_part) < length_or_size:
                             hex_str += f" ... ({length_or_size} bytes total)"
-                        yield current_indent + f'{accumulated_str}: {hex_str}'
+                        yield f'{current_indent}{accumulated_str}: {hex_str}'
                 else:
                     # Get the data (limited by max_binary_bytes) and format them
                     binary_part = self._read_raw_data(max_bytes=max_binary_bytes) if length_or_size > 0 else b''
                     # For other types, convert to space-separated hex
-                    hex_str = ' '.join(f'{b:02x}' for b in binary_part)
+                    hex_str = binary_part.hex(' ')
                     if len(binary_part) < length_or_size:
                         hex_str += f" ... ({length_or_size} bytes total)"
-                    yield current_indent + f'{accumulated_str}: {hex_str}'
+                    yield f'{current_indent}{accumulated_str}: {hex_str}'
         except Exception as e:
             # If we have any accumulated strings when an exception occurs, output them
             if accumulated_strings:
                 accumulated_str = "".join(accumulated_strings)
-                yield ' ' * min(indent_level, max_indent_level) * indent_size + f'{accumulated_str}'
+                yield indents[min(indent_level, max_indent_level)] + accumulated_str
             # Get the current file position for debugging
-            current_pos = self.file.tell()
+            current_pos = self._getPos()
             raise Exception(f"Error at file position {current_pos}: {str(e)}")
             # Don't re-raise the exception to allow partial output
 
@@ -1041,59 +1435,59 @@ class XTypeFileReader:
         # Track accumulated length multipliers for arrays
         length_multiplier = 1
 
+        # Attributes that don't change while reading. The buffer state is read
+        # from self in each iteration, because it may change between yields
+        byte_actions = self._byte_actions
+        GRAMMAR, DIGIT, LENGTH = self._GRAMMAR, self._DIGIT, self._LENGTH
+
         while True:
-            # Skip any pending binary data from previous call if not consumed
+            # Skip any pending binary data from previous call if not consumed.
+            # If it reaches beyond the buffer, the next refill seeks past it
+            pos = self._buf_pos
             if self._pending_binary_size > 0:
-                self.file.seek(self._pending_binary_size, 1)  # Seek relative to current position
+                pos += self._pending_binary_size
                 self._pending_binary_size = 0
 
-            # Read one byte
-            char_byte = self.file.read(1)
-
-            # Check for EOF
-            if not char_byte:
-                break
-
-            try:
-                char = char_byte.decode('ascii')
-            except UnicodeDecodeError:
-                # If we can't decode as ASCII, it's likely binary data that wasn't properly skipped
-                # This can happen with string arrays where the binary data contains non-ASCII characters
-                raise ValueError(f"Encountered non-ASCII character in grammar. This may indicate binary data wasn't properly skipped.")
+            # Read one byte from the read-ahead buffer, check for EOF
+            if pos >= len(self._buf):
+                self._buf_pos = pos
+                if not self._fill_buffer():
+                    break
+                pos = self._buf_pos
+            byte = self._buf[pos]
+            self._buf_pos = pos + 1
+
+            action = byte_actions[byte]
+            if action is None:
+                if byte > 0x7F:
+                    # If we can't decode as ASCII, it's likely binary data that wasn't properly skipped
+                    # This can happen with string arrays where the binary data contains non-ASCII characters
+                    raise ValueError(f"Encountered non-ASCII character in grammar. This may indicate binary data wasn't properly skipped.")
+                # If we get here, we encountered an unexpected character
+                raise ValueError(f"Unexpected character in xtype file: {repr(chr(byte))}")
+            kind, char, value = action
 
             # Handle grammar terminal symbols
-            if char in '[]{}TFn*':
+            if kind == GRAMMAR:
                 yield (char, 0, 0)
                 continue
 
             # Handle direct length information (0-9)
-            if char in '0123456789':
-                yield (char, 1, int(char))
+            if kind == DIGIT:
+                yield (char, 1, value)
                 # Multiply this length multiplier
-                length_multiplier *= int(char)
+                length_multiplier *= value
                 continue
 
             # Handle length information (M, N, O, P)
-            if char in 'MNOP':
-                size = {'M': 1, 'N': 2, 'O': 4, 'P': 8}[char]
-                # binary_position = self.file.tell()
-                binary_data = self.file.read(size)
+            if kind == LENGTH:
+                # Unsigned length of 1, 2, 4 or 8 bytes
+                binary_data = self._read_bytes(value.size)
 
-                if len(binary_data) < size:
+                if len(binary_data) < value.size:
                     raise ValueError(f"Unexpected end of file when reading length of type {char}")
 
-                # Convert binary to integer value based on type
-                if char == 'M':  # uint8
-                    value = binary_data[0]
-                elif char == 'N':  # uint16
-                    value = int.from_bytes(binary_data, byteorder=self.byteorder, signed=False)
-                elif char == 'O':  # uint32
-                    value = int.from_bytes(binary_data, byteorder=self.byteorder, signed=False)
-                elif char == 'P':  # uint64
-                    value = int.from_bytes(binary_data, byteorder=self.byteorder, signed=False)
-
-                # Set pending binary size to 0 since we already consumed the binary data
-                self._pending_binary_size = 0
+                value, = value.unpack(binary_data)
 
                 # Yield the length information and size
                 yield (char, 1, value)
@@ -1102,24 +1496,105 @@ class XTypeFileReader:
                 length_multiplier *= value
                 continue
 
-            # Handle data types
-            if char in self.type_sizes:
-                # For actual data types, calculate the total data size
-                type_size = self.type_sizes[char]
+            # Handle data types: calculate the total size based on the element
+            # size and the accumulated length multiplier
+            total_size = value * length_multiplier
+
+            # Don't read the binary data yet, just note its size
+            self._pending_binary_size = int(total_size)
+            self._pending_binary_type = char
 
-                # Calculate total size based on accumulated length multiplier
-                total_size = type_size * length_multiplier
+            yield (char, 2, total_size)
+            length_multiplier = 1  # Reset length multiplier after using it
+
+    def _skip_elements(self, count: int, positions: List[int] = None) -> int:
+        """
+        Skip elements of a list or dictionary directly in the memory map.
 
-                # Don't read the binary data yet, just note its size
-                self._pending_binary_size = int(total_size)
-                self._pending_binary_type = char
+        The grammar is scanned byte by byte with the parse action table, without
+        creating symbols, shapes or values. Elements preceded by footnotes are
+        skipped together with their footnotes. If the closing bracket or brace
+        of the container is reached, it is consumed and the scan stops. The end
+        of the file closes the container, an element that is cut off by it is
+        counted like read() returns it.
 
-                yield (char, 2, total_size)
-                length_multiplier = 1  # Reset length multiplier after using it
+        Args:
+            count: Number of elements to skip
+            positions: Optional list to append the file position of each skipped element to
+
+        Returns:
+            int: The number of elements skipped, less than count at the end of
+             the container or the file
+        """
+        byte_actions = self._byte_actions
+        GRAMMAR, DIGIT, LENGTH = self._GRAMMAR, self._DIGIT, self._LENGTH
+        buf = self._mmap
+        end = len(buf)
+        pos = self._buf_pos + self._pending_binary_size
+        self._pending_binary_size = 0
+
+        skipped = 0
+        nestedCount = 0
+        footnotes = 0  # Pending footnotes of the next element
+        length_multiplier = 1
+        start = None  # Position of the element, including its footnotes
+        while skipped < count:
+            if pos >= end:
+                # The end of the file closes the container, including an element
+                # that has been started
+                if start is not None:
+                    skipped += 1
+                    if positions is not None:
+                        positions.append(start)
+                break
+            if start is None:
+                start = pos
+            action = byte_actions[buf[pos]]
+            if action is None:
+                # Let the generic parser report the unexpected byte
+                self._buf_pos = pos
+                self._read_type()
+            pos += 1
+            kind, char, value = action
+            if kind == GRAMMAR:
+                if char in '[{':
+                    nestedCount += 1
+                    continue
+                if char == '*':
+                    if nestedCount == 0:
+                        footnotes += 1
+                    continue
+                if char in ']}':
+                    if nestedCount == 0:
+                        # End of the container
+                        break
+                    nestedCount -= 1
+            elif kind == DIGIT:
+                length_multiplier *= value
+                continue
+            elif kind == LENGTH:
+                if pos + value.size > end:
+                    raise ValueError(f"Unexpected end of file when reading length of type {char}")
+                length_multiplier *= value.unpack_from(buf, pos)[0]
+                pos += value.size
                 continue
+            else:
+                # Skip the binary data of the type
+                pos += value * length_multiplier
+                length_multiplier = 1
+
+            # An object is complete
+            if nestedCount == 0:
+                if footnotes:
+                    footnotes -= 1
+                else:
+                    skipped += 1
+                    if positions is not None:
+                        positions.append(start)
+                    start = None
 
-            # If we get here, we encountered an unexpected character
-            raise ValueError(f"Unexpected character in xtype file: {repr(char)}")
+        self._buf_pos = pos
+        return skipped
 
     def _read_header(self) -> Tuple[str, int, List[int], List[Tuple]]:
         """
@@ -1133,22 +1608,18 @@ class XTypeFileReader:
                 - footnotes: List of all footnote elements (can be empty)
         """
         footnotes = []
-        isFootnote = True
 
-        while isFootnote:
+        while True:
             # Read the next header from the file
             symbol, size, shape = self._read_type()
 
-            if symbol == '*':
-                # This is a footnote marker
-                # Read the footnote content that follows the marker
-                footnote = ObjectProxy(self.xtFile, onlyContent=True)
-                footnotes.append(footnote)
-            else:
+            if symbol != '*':
                 # This is not a footnote, so we're done
-                isFootnote = False
+                return symbol, size, shape, footnotes
 
-        return symbol, size, shape, footnotes
+            # This is a footnote marker
+            # Read the footnote content that follows the marker
+            footnotes.append(ObjectProxy(self.xtFile, onlyContent=True))
 
     def _read_type(self) -> Tuple[str, int, List[int]]:
         """
@@ -1175,7 +1646,7 @@ class XTypeFileReader:
         # Process raw elements until we find a complete logical element
         for symbol, flag, length_or_size in self._read_raw():
             # Case 1: Grammar terminals (single symbols)
-            if symbol in '[]{}TFn*':
+            if flag == 0:
                 return symbol, 0, []
 
             # Case 2: Length information (0-9, M, N, O, P)
@@ -1199,6 +1670,11 @@ class XTypeFileReader:
         Returns:
             The Python object read from the file
         """
+        # Simple elements and closing symbols are read directly from the buffer
+        # if possible, without the generic header parsing
+        value = self._read_fast()
+        if value is not self._NOT_FAST:
+            return value
 
         symbol, size, shape, footnotes = self._read_header()
 
@@ -1219,23 +1695,7 @@ class XTypeFileReader:
         Returns:
             The Python object read from the file
         """
-        # Handle special symbols first
-        if symbol == '[':
-            # List
-            return self._read_list()
-        elif symbol == '{':
-            # Dictionary
-            return self._read_dict()
-        elif symbol == 'T':
-            # True
-            return True
-        elif symbol == 'F':
-            # False
-            return False
-        elif symbol == 'n':
-            # None
-            return None
-        elif symbol in self.type_sizes:
+        if symbol in self.type_sizes:
             # Check if this is an array type or a single element
             if shape:
                 # This is an array type
@@ -1243,9 +1703,13 @@ class XTypeFileReader:
             else:
                 # This is a basic element (scalar, string or binary sequence)
                 return self._read_basic_element(symbol, size)
-        else:
+
+        # Grammar symbols: lists, dictionaries and constants
+        reader = self._symbol_readers.get(symbol)
+        if reader is None:
             # Unexpected symbol
             raise ValueError(f"Unexpected symbol in xtype file: {symbol}")
+        return reader()
 
     def _read_basic_element(self, type_code: str, size: int) -> Any:
         """
@@ -1258,36 +1722,37 @@ class XTypeFileReader:
         Returns:
             The element read from the file
         """
+        unpacker = self._scalar_unpackers.get(type_code)
+        if unpacker is not None:
+            # Boolean (any non-zero byte is True), integers and floating point.
+            # Scalars within the read-ahead buffer are unpacked in place
+            pos = self._buf_pos
+            if size == unpacker.size == self._pending_binary_size and pos + size <= len(self._buf):
+                self._buf_pos = pos + size
+                self._pending_binary_size = 0
+                return unpacker.unpack_from(self._buf, pos)[0]
+            return unpacker.unpack(self._read_raw_data(size))[0]
+
+        pos = self._buf_pos
+        if (type_code == 's' and size > self._READ_AHEAD and
+                size <= self._pending_binary_size and pos + size <= len(self._buf)):
+            # Large strings within the memory map are decoded directly from it.
+            # The decoder validates the UTF-8 and copies in a single pass
+            self._buf_pos = pos + size
+            self._pending_binary_size -= size
+            with memoryview(self._buf) as view, view[pos:pos + size] as part:
+                return str(part, 'utf-8')
+
         # Read the binary data
         binary_data = self._read_raw_data(size)
 
         # Parse based on type code
-        if type_code == 'b':
-            # Boolean
-            return binary_data[0] != 0
-        elif type_code in 'ijkl':
-            # Signed integers
-            return int.from_bytes(binary_data, byteorder=self.byteorder, signed=True)
-        elif type_code in 'IJKL':
-            # Unsigned integers
-            return int.from_bytes(binary_data, byteorder=self.byteorder, signed=False)
-        elif type_code in 'hfd':
-            # Floating point
-            if type_code == 'h':
-                # float16
-                return struct.unpack(f'{self.struct_byteorder}e', binary_data)[0]
-            elif type_code == 'f':
-                # float32
-                return struct.unpack(f'{self.struct_byteorder}f', binary_data)[0]
-            elif type_code == 'd':
-                # float64
-                return struct.unpack(f'{self.struct_byteorder}d', binary_data)[0]
-        elif type_code == 's':
+        if type_code == 's':
             # String
             return binary_data.decode('utf-8')
         elif type_code == 'x':
             # Bytes
-            return binary_data
+            return bytes(binary_data)
         else:
             # Unsupported type
             raise ValueError(f"Unsupported type code: {type_code}")
@@ -1303,6 +1768,18 @@ class XTypeFileReader:
 
         # Parse each element until we hit a closing bracket
         while True:
+            # Scalars are read directly from the buffer if possible
+            pos = self._buf_pos
+            value = self._read_fast()
+            if value is not self._NOT_FAST:
+                if type(value) is not tuple:
+                    result.append(value)
+                    continue
+                if value[0] == ']':
+                    break
+                # Let the generic path handle other closing symbols
+                self._buf_pos = pos
+
             symbol, size, shape = self._read_type()
 
             if symbol == ']' or symbol == '':
@@ -1333,6 +1810,25 @@ class XTypeFileReader:
 
         # Parse key-value pairs until we hit a closing brace
         while True:
+            # Short string keys and scalar values are read directly from the
+            # buffer if possible
+            pos = self._buf_pos
+            key = self._read_fast()
+            if type(key) is str:
+                pos = self._buf_pos
+                value = self._read_fast()
+                if value is not self._NOT_FAST and type(value) is not tuple:
+                    result[key] = value
+                    continue
+                self._buf_pos = pos
+                self._read_dict_value(result, key)
+                continue
+            if key is not self._NOT_FAST:
+                if key == ('}',):
+                    break
+                # Let the generic path handle other keys
+                self._buf_pos = pos
+
             # Read the key
             symbol, size, shape = self._read_type()
 
@@ -1353,7 +1849,10 @@ class XTypeFileReader:
                 if shape:
                     # Int array type
                     intArray = self._read_numpy_array(shape, symbol, size)
-                    key = self._convert_to_deep_tuple(intArray.tolist())
+                    if intArray.ndim == 1:
+                        key = tuple(intArray.tolist())
+                    else:
+                        key = self._convert_to_deep_tuple(intArray.tolist())
                 else:
                     # Int element
                     key = int(self._read_basic_element(symbol, size))
@@ -1361,7 +1860,10 @@ class XTypeFileReader:
                 if shape:
                     # Float array type
                     intArray = self._read_numpy_array(shape, symbol, size)
-                    key = self._convert_to_deep_tuple(intArray.tolist())
+                    if intArray.ndim == 1:
+                        key = tuple(intArray.tolist())
+                    else:
+                        key = self._convert_to_deep_tuple(intArray.tolist())
                 else:
                     # Float element
                     key = float(self._read_basic_element(symbol, size))
@@ -1369,23 +1871,78 @@ class XTypeFileReader:
                 # Unexpected symbol for key
                 raise ValueError(f"Unexpected key type in dictionary: {symbol}")
 
-            # Read the value
-            symbol, size, shape = self._read_type()
+            self._read_dict_value(result, key)
 
-            # We're reading a value
-            if symbol in self.type_sizes:
-                # Data type
-                if shape and (symbol not in 'sx' or len(shape) > 1):
-                    # Array type
-                    result[key] = self._read_numpy_array(shape, symbol, size)
-                else:
-                    # Basic element
-                    result[key] = self._read_basic_element(symbol, size)
+        return result
+
+    def _read_dict_value(self, result: Dict, key: Any):
+        """
+        Read the value of a dictionary entry.
+
+        Args:
+            result: The dictionary to store the value in
+            key: The key of the value
+        """
+        symbol, size, shape = self._read_type()
+
+        # We're reading a value
+        if symbol in self.type_sizes:
+            # Data type
+            if shape and (symbol not in 'sx' or len(shape) > 1):
+                # Array type
+                result[key] = self._read_numpy_array(shape, symbol, size)
             else:
-                # Special symbol or container
-                result[key] = self._read_element(symbol, size, shape)
+                # Basic element
+                result[key] = self._read_basic_element(symbol, size)
+        else:
+            # Special symbol or container
+            result[key] = self._read_element(symbol, size, shape)
 
-        return result
+    def _read_fast(self) -> Any:
+        """
+        Read a simple element directly from the read-ahead buffer.
+
+        Handles scalars, True, False, None, strings and bytes with up to 9 bytes
+        and the closing symbols of containers, which are returned as tuples
+        (']',) and ('}',). Elements that are not completely in the buffer and
+        all other elements are left to the generic path.
+
+        Returns:
+            The element, or _NOT_FAST if nothing was read
+        """
+        if self._pending_binary_size:
+            return self._NOT_FAST
+        buf = self._buf
+        pos = self._buf_pos
+        if pos >= len(buf):
+            return self._NOT_FAST
+        action = self._fast_actions[buf[pos]]
+        if action is None:
+            return self._NOT_FAST
+        kind, value = action
+        if kind == self._GRAMMAR:
+            # Constant value or closing symbol
+            self._buf_pos = pos + 1
+            return value
+        if kind == self._TYPE:
+            # Scalar with its precompiled struct object
+            end = pos + 1 + value.size
+            if end > len(buf):
+                return self._NOT_FAST
+            self._buf_pos = end
+            return value.unpack_from(buf, pos + 1)[0]
+        # Length digit, only followed by the type codes s and x
+        end = pos + 2 + value
+        if end > len(buf):
+            return self._NOT_FAST
+        type_code = buf[pos + 1]
+        if type_code == 0x73:  # 's'
+            self._buf_pos = end
+            return buf[pos + 2:end].decode('utf-8')
+        if type_code == 0x78:  # 'x'
+            self._buf_pos = end
+            return bytes(buf[pos + 2:end])
+        return self._NOT_FAST
 
     def _read_numpy_array(self, shape: List[int], type_code: str, size: int) -> np.ndarray:
         """
@@ -1407,17 +1964,19 @@ class XTypeFileReader:
         Raises:
             ValueError: If an unsupported array type is encountered
         """
-        # Read the binary data
-        binary_data = self._read_raw_data(size)
-
         # Special handling for string arrays
         if type_code in 'sxu':
+            # Read the binary data
+            binary_data = self._read_raw_data(size)
+
             # For 1D arrays, return a Python string
             if len(shape) == 1:
                 if type_code == 's':
                     binary_data = binary_data.decode('utf-8')
                 elif type_code == 'u':
                     binary_data = binary_data.decode('utf-16')
+                else:
+                    binary_data = bytes(binary_data)
                 # Decode the binary data as UTF-8 and return as a string
                 return binary_data
             else:
@@ -1433,24 +1992,18 @@ class XTypeFileReader:
                 for dim in array_dims:
                     total_strings *= dim
 
-                # Create a numpy array of fixed-length strings
-                string_array = np.empty(array_dims, dtype=f'S{string_length}')
-
-                # Fill the array with the strings from binary_data
-                flat_array = string_array.reshape(-1)
+                if string_length == 0:
+                    # NumPy has no zero-length strings, use empty strings of length 1
+                    return np.zeros(array_dims, dtype='S1')
 
-                for i in range(total_strings):
-                    start = i * string_length
-                    end = start + string_length
-                    if start < len(binary_data):
-                        # Get the string data, ensuring we don't go past the end of binary_data
-                        string_data = binary_data[start:min(end, len(binary_data))]
-                        # Pad with zeros if needed
-                        if len(string_data) < string_length:
-                            string_data = string_data.ljust(string_length, b'\x00')
-                        flat_array[i] = string_data
+                # Trim or pad the data (e.g. after UTF-16 conversion) to the array size
+                total_size = total_strings * string_length
+                if len(binary_data) != total_size:
+                    binary_data = binary_data[:total_size].ljust(total_size, b'\x00')
 
-                return string_array.reshape(array_dims)
+                # Create a numpy array of fixed-length strings directly from the data
+                string_array = np.frombuffer(binary_data, dtype=f'S{string_length}', count=total_strings)
+                return string_array.reshape(array_dims).copy()
 
         # Get the NumPy dtype
         if type_code not in self.dtype_map:
@@ -1464,23 +2017,12 @@ class XTypeFileReader:
             total_elements *= dim
 
         # Create a flat array first
-        if type_code == 'b':
-            # Handle boolean arrays specially (0x00 for False, anything else for True)
-            flat_array = np.frombuffer(binary_data, dtype=np.uint8)
-            flat_array = flat_array != 0
-        elif type_code in 'jklJKLhfd':
-            # Signed integers
-            flat_array = np.frombuffer(binary_data, dtype=dtype)
-        elif type_code in 'iIx':
-            # Floating point
-            flat_array = np.frombuffer(binary_data, dtype=dtype)
+        if type_code in 'bjklJKLhfdiIx':
+            flat_array = self._read_raw_array(np.dtype(dtype), size)
         else:
             # Unsupported type
             raise ValueError(f"Unsupported NumPy type: {type_code}")
 
-        if self.need_byteswap:
-            flat_array = flat_array.byteswap()
-
         # Reshape the array to the specified shape
         return flat_array.reshape(shape)
 
@@ -1496,7 +2038,10 @@ class XTypeFileReader:
         """
         if not isinstance(lst, list):
             return lst
-        return tuple(self._convert_to_deep_tuple(i) for i in lst)
+        if list in map(type, lst):
+            return tuple(map(self._convert_to_deep_tuple, lst))
+        # Innermost level, e.g. the last axis of an array
+        return tuple(lst)
 
     def _read_raw_data(self, max_bytes: int = None) -> bytes:
         """
@@ -1531,7 +2076,7 @@ class XTypeFileReader:
             bytes_to_read = max_bytes
 
         # Read the binary data
-        binary_data = self.file.read(bytes_to_read)
+        binary_data = self._read_bytes(bytes_to_read)
         if len(binary_data) < bytes_to_read:
             raise ValueError(f"Unexpected end of file when reading data of type {self._pending_binary_type}")
 
@@ -1540,6 +2085,145 @@ class XTypeFileReader:
 
         return binary_data
 
+    def _read_raw_array(self, dtype: np.dtype, size: int) -> np.ndarray:
+        """
+        Read the pending binary data as a flat array.
+
+        Booleans are normalized (0x00 for False, anything else for True) and
+        multi-byte elements are converted from the byte order of the file.
+        Data of a memory-mapped file is copied from the map in the same pass,
+        by reading it with a byte-swapped dtype and converting it if needed,
+        so the array never references the map and stays valid after the file
+        is closed. Data that is read from the file is converted in place.
+
+        Args:
+            dtype: The NumPy dtype of the array in native byte order
+            size: The size of the binary data in bytes
+
+        Returns:
+            np.ndarray: The flat array
+        """
+        pos = self._buf_start + self._buf_pos
+        mapped = (self._mmap is not None and self._buf is self._mmap and
+                  size <= self._pending_binary_size and pos + size <= len(self._mmap))
+        if mapped:
+            source, offset = self._mmap, pos
+            self._buf_pos += size
+            self._pending_binary_size -= size
+        elif size > self._READ_AHEAD and size <= self._pending_binary_size:
+            # Large data is read directly into the memory of the array, which
+            # is then converted in place
+            source, offset = np.empty(size, dtype=np.uint8), 0
+            if self._read_bytes_into(source) < size:
+                raise ValueError(f"Unexpected end of file when reading data of type {self._pending_binary_type}")
+            self._pending_binary_size -= size
+        else:
+            source, offset = self._read_raw_data(size), 0
+
+        if dtype == np.bool_:
+            # The comparison is the single pass that normalizes the stored 0xFF
+            # to the 0x01 bytes of NumPy booleans. Data read into memory of its
+            # own is normalized in place
+            flat_bytes = np.frombuffer(source, dtype=np.uint8, count=size, offset=offset)
+            if mapped or not flat_bytes.flags.writeable:
+                return flat_bytes != 0
+            return np.not_equal(flat_bytes, 0, out=flat_bytes.view(np.bool_))
+        count = size // dtype.itemsize
+        flat_array = np.frombuffer(source, dtype=dtype, count=count, offset=offset)
+        if self.need_byteswap:
+            if mapped or not flat_array.flags.writeable:
+                return np.frombuffer(source, dtype=dtype.newbyteorder(), count=count, offset=offset).astype(dtype)
+            flat_array.byteswap(inplace=True)
+            return flat_array
+        return flat_array.copy() if mapped else flat_array
+
+    def _fill_buffer(self) -> bool:
+        """
+        Read the next bytes of the file at the current position into the read-ahead buffer.
+
+        Returns:
+            bool: False if the end of the file is reached
+        """
+        start = self._buf_start + self._buf_pos
+        if self._mmap is not None:
+            # The whole file is mapped, only the end of the file is left
+            self._buf = self._mmap
+            self._buf_start = 0
+            self._buf_pos = start
+            return start < len(self._mmap)
+        # The bytes are read into the same bytearray on every refill
+        self.file.seek(start)
+        size = self.file.readinto(self._read_ahead)
+        self._buf = self._read_ahead if size == self._READ_AHEAD else self._read_ahead[:size]
+        self._buf_start = start
+        self._buf_pos = 0
+        return len(self._buf) > 0
+
+    def _read_bytes(self, size: int) -> bytes:
+        """
+        Read bytes at the current position.
+
+        The bytes are taken from the read-ahead buffer if it holds all of them.
+        Small reads that extend beyond the buffer refill it at the current
+        position, so the grammar that follows is read from the same refill.
+        Larger reads go directly to the file and empty the buffer.
+
+        Args:
+            size: Number of bytes to read
+
+        Returns:
+            bytes: The bytes read, fewer than size at the end of the file. Bytes
+             of the read-ahead buffer may be returned as a bytearray
+        """
+        start = self._buf_pos
+        end = start + size
+        if end <= len(self._buf):
+            self._buf_pos = end
+            return self._buf[start:end]
+        if size <= self._READ_AHEAD:
+            # The refill starts at the current position, except for the memory
+            # map, which keeps the absolute position
+            self._fill_buffer()
+            start = self._buf_pos
+            data = self._buf[start:start + size]
+            self._buf_pos = start + len(data)
+            return data
+        pos = self._buf_start + start
+        self.file.seek(pos)
+        data = self.file.read(size)
+        self._buf = b''
+        self._buf_start = pos + len(data)
+        self._buf_pos = 0
+        return data
+
+    def _read_bytes_into(self, buffer: np.ndarray) -> int:
+        """
+        Read bytes at the current position directly from the file into a buffer.
+
+        Used for data larger than the read-ahead buffer, which is emptied.
+
+        Args:
+            buffer: The writable buffer to fill
+
+        Returns:
+            int: The number of bytes read, fewer than the buffer size at the end of the file
+        """
+        pos = self._buf_start + self._buf_pos
+        self.file.seek(pos)
+        n = self.file.readinto(buffer)
+        self._buf = b''
+        self._buf_start = pos + n
+        self._buf_pos = 0
+        return n
+
+    def _drop_buffer(self):
+        """
+        Discard the read-ahead buffer, e.g. after data was written to the file.
+        """
+        self._buf_start += self._buf_pos
+        self._buf = b''
+        self._buf_pos = 0
+
     def _read_bom(self):
         """
         Read the byte order mark (BOM) and adjust the byteorder if needed.
@@ -1566,6 +2250,8 @@ class XTypeFileReader:
 
             # If the value is -11772, we need to switch the byteorder
             self.need_byteswap = bom_value == -11772
+            # Continue reading after the BOM
+            self._setPos(self.file.tell())
         elif len(marker) == 0:
             raise EmptyFile
         else:
@@ -1584,6 +2270,14 @@ class ObjectProxy:
 
     fileEnd, listEnd, dictEnd = [(i,) for i in ('',']','}')]
 
+    # Key argument of _find_value() that records all keys of a dictionary
+    _ALL_KEYS = object()
+
+    # Reading array chunks: bytes between runs of chunks that are read rather
+    # than starting a new read, and the largest range read at once for that
+    _RUN_GAP = 1 << 14
+    _MAX_SPAN = 1 << 26
+
     def __init__(self, xtFile: File, position: int = -1, onlyContent: bool = False):
         """
         Initialize an ObjectProxy.
@@ -1597,10 +2291,10 @@ class ObjectProxy:
         self.writer: XTypeFileWriter = xtFile.writer
 
         if position < 0:
-            self.position = self.xtFile.file.tell()
+            self.position = self.reader._getPos()
         else:
             # Move file pointer to the specified position
-            self.xtFile.file.seek(position)
+            self.reader._setPos(position)
             self.position = position
 
         if onlyContent:
@@ -1621,6 +2315,17 @@ class ObjectProxy:
         self.shape = shape
         self.footnotes = footnotes
 
+        # Positions of the items of a list, recorded by _item_positions(), or the keys
+        # of a dictionary and the positions of their values, recorded by _find_value()
+        self._positions = []
+        self._keys = []
+        self._value_positions = {}
+        self._positions_complete = False
+        self._scan_position = self.data_position
+
+        # Map, array view of the map and result data type, set by _index_mapped_array()
+        self._mapped_view = None
+
     def _reset_reading(self) -> None:
         """Reset the reader position to the data position of this object."""
         # Move to the position of this object
@@ -1664,27 +2369,56 @@ class ObjectProxy:
         if self.symbol != '{':
             raise TypeError(f"Object of type '{self.symbol}' is not a dictionary")
 
-        self._reset_reading()
+        # Read the remaining keys while skipping values
+        self._find_value(self._ALL_KEYS)
+        return list(self._keys)
+
+    def _find_value(self, item: Any) -> Optional[int]:
+        """
+        Get the file position of the value of a key of the dictionary.
 
-        # Read keys while skipping values
-        keys = []
+        The keys and the positions of their values are recorded while scanning
+        the dictionary and kept for later calls. The scan continues after the
+        last recorded key until the key is found, so each key is read at most once.
+
+        Args:
+            item: The key to find, _ALL_KEYS to record all keys
+
+        Returns:
+            Optional[int]: The position of the value, None if the key is not in the dictionary
+        """
+        try:
+            position = self._value_positions.get(item)
+        except TypeError:
+            # Unhashable objects are no keys
+            return None
+        if position is not None or self._positions_complete:
+            return position
+
+        reader = self.reader
+        reader._setPos(self._scan_position)
         while True:
-            key_symbol, key_size, key_shape = self.reader._read_type()
+            key_symbol, key_size, key_shape = reader._read_type()
 
             # Check if we've reached the end of the dictionary
             if key_symbol == '}':
-                break
+                self._positions_complete = True
+                return None
 
-            # Read the key
-            key = self.reader._read_element(key_symbol, key_size, key_shape)
+            # Read the key and convert lists to tuples if needed (for hashability)
+            key = reader._read_element(key_symbol, key_size, key_shape)
             if isinstance(key, list):
-                key = self.reader._convert_to_deep_tuple(key)
+                key = reader._convert_to_deep_tuple(key)
 
-            keys.append(key)
-            # Skip the value
-            self._skip_object()
+            # Record the key and the position of its value, then skip the value
+            position = reader._getPos(withPendingBinary=True)
+            self._keys.append(key)
+            self._value_positions.setdefault(key, position)
+            self._skip_items(1)
+            self._scan_position = reader._getPos(withPendingBinary=True)
 
-        return keys
+            if key == item:
+                return position
 
     def __len__(self):
         """
@@ -1709,25 +2443,8 @@ class ObjectProxy:
             # For dictionaries, use the keys method to get the length
             return len(self.keys())
         elif self.symbol == '[':
-            # For lists, count the number of items
-            count = 0
-
-            # Read items until end of list or EOF
-            try:
-                # Skip each item until we reach the end of the list (']')
-                while True:
-                    # Skip the item and check its returned symbol
-                    symbol = self._skip_object()
-
-                    # If we've reached the end of the list, stop counting
-                    if symbol == ']':
-                        break
-
-                    # Otherwise, increment the counter
-                    count += 1
-            except EOFError:
-                # Handle case where EOF closes the list
-                pass
+            # For lists, count the number of items by skipping them until end of list or EOF
+            count = len(self._item_positions(sys.maxsize))
 
             self._reset_reading()
             return count
@@ -1753,6 +2470,15 @@ class ObjectProxy:
             Either an ObjectProxy instance or a primitive value depending on the object type
         """
 
+        # Scalars and short strings are read directly from the buffer if possible
+        reader = self.reader
+        pos = reader._buf_pos
+        value = reader._read_fast()
+        if value is not reader._NOT_FAST:
+            if type(value) is not tuple:
+                return value
+            reader._buf_pos = pos
+
         obj = ObjectProxy(self.xtFile)
 
         # Peek at the next object information to determine its type
@@ -1771,31 +2497,102 @@ class ObjectProxy:
         Skip over an object in the file.
 
         Handles footnotes and correctly counts opening and closing brackets/braces
-        to ensure proper balance is maintained.
+        to ensure proper balance is maintained. The whole object is skipped with
+        a single pass of _read_raw(), the binary data is skipped without reading it.
 
         Returns:
             str: The symbol that was found after skipping (usually the next element's symbol
              or a closing bracket/brace)
         """
-        symbol = '-'
+        return self._skip_raw(self.reader._read_raw())
+
+    def _item_positions(self, count: int) -> List[int]:
+        """
+        Get the file positions of the first items of the list.
+
+        The positions are recorded while skipping the items and kept for later
+        calls, so each item of the list is skipped at most once.
+
+        Args:
+            count: Number of items needed
+
+        Returns:
+            List[int]: The positions of all recorded items, fewer than count if the list is shorter
+        """
+        positions = self._positions
+        if len(positions) < count and not self._positions_complete:
+            self.reader._setPos(self._scan_position)
+            missing = count - len(positions)
+            if self._skip_items(missing, positions) < missing:
+                self._positions_complete = True
+            self._scan_position = self.reader._getPos(withPendingBinary=True)
+        return positions
+
+    def _skip_items(self, count: int, positions: List[int] = None) -> int:
+        """
+        Skip items of the list or dictionary at the current reading position.
+
+        Args:
+            count: Number of items to skip
+            positions: Optional list to append the file position of each skipped item to
+
+        Returns:
+            int: The number of items skipped, less than count if the end of the
+             container was reached, in which case the closing symbol is consumed,
+             or the end of the file
+        """
+        reader = self.reader
+        if reader._mmap is not None and reader._buf is reader._mmap:
+            return reader._skip_elements(count, positions)
+        raw = reader._read_raw()
+        skipped = 0
+        try:
+            while skipped < count:
+                pos = reader._getPos(withPendingBinary=True)
+                if self._skip_raw(raw) in ']}':
+                    break
+                skipped += 1
+                if positions is not None:
+                    positions.append(pos)
+        except EOFError:
+            # The end of the file closes the container, including an item
+            # that has been started
+            if reader._getPos(withPendingBinary=True) > pos:
+                skipped += 1
+                if positions is not None:
+                    positions.append(pos)
+        return skipped
+
+    def _skip_raw(self, raw: Iterator[Tuple[str, int, int]]) -> str:
+        """
+        Skip over the next object yielded by the given _read_raw() iterator.
+
+        Args:
+            raw: The running _read_raw() iterator, footnotes are skipped with the same one
+
+        Returns:
+            str: The first symbol of the object, a closing bracket/brace if the
+             object is the end of a list or dictionary
+        """
+        symbol = None
         nestedCount = 0
-        while nestedCount > 0 or symbol == '-':
-            next_symbol, size, shape = self.reader._read_type()
+        for next_symbol, flag, _ in raw:
+            if flag == 1:
+                # Length information of the following type
+                continue
             if next_symbol == '*':
                 # Skip over footnote content
-                self._skip_object()
-            elif next_symbol in '[{':
+                self._skip_raw(raw)
+                continue
+            if next_symbol in '[{':
                 nestedCount += 1
             elif next_symbol in ']}':
                 nestedCount -= 1
-            elif nestedCount == 0:
-                symbol = next_symbol
-                break
-            else:
-                symbol = next_symbol
-            if symbol == '-':
+            if symbol is None:
                 symbol = next_symbol
-        return symbol
+            if nestedCount <= 0:
+                return symbol
+        raise EOFError("Unexpected end of file while skipping an object")
 
     def __getitem__(self, item: Union[int, str, slice, List[int], np.ndarray, Tuple]) -> Any:
         """
@@ -1840,17 +2637,13 @@ class ObjectProxy:
         if self.symbol == '[':
             # Handle list indexing - both integer and slice access
             if isinstance(item, int):
-                # Integer indexing - handle as before
-                # Sequential access: read and skip objects until we reach the specified index
-                # Note: This is O(n) access as we must traverse the list sequentially
-                index = 0
-                while index < item:
-                    # Skip current object and check if we've reached the end of the list
-                    next_symbol = self._skip_object()
-                    if next_symbol == ']':
-                        # We've reached the end of the list before finding the desired index
-                        raise IndexError(f"List index {item} out of range, list has only {index} elements")
-                    index += 1
+                # Integer indexing: the positions of the items are recorded on the
+                # first access, later accesses go directly to the item
+                positions = self._item_positions(item + 1 if item >= 0 else sys.maxsize)
+                if not -len(positions) <= item < len(positions):
+                    # We've reached the end of the list before finding the desired index
+                    raise IndexError(f"List index {item} out of range, list has only {len(positions)} elements")
+                self.reader._setPos(positions[item])
 
                 # Get the appropriate return value (ObjectProxy or primitive)
                 return self._get_item_value()
@@ -1873,41 +2666,24 @@ class ObjectProxy:
                 elif step == 0:
                     raise ValueError("Step size cannot be zero")
 
-                # Create the list to store our results
+                # Positions of the items up to the end of the slice
+                if stop == float('inf'):
+                    positions = self._item_positions(sys.maxsize)[start::step]
+                else:
+                    positions = self._item_positions(stop)
+                    count = len(positions)
+                    if start <= count:
+                        # An explicit stop must not select indices after the end of the list
+                        index = start + -(-(count - start) // step) * step
+                        if index < stop:
+                            raise IndexError(f"List index {index} out of range, list has only {count} elements")
+                    positions = positions[start:stop:step]
+
+                # Read the objects directly without creating new ObjectProxies
                 result = []
-                next_symbol = '-'
-
-                # Skip to start position
-                index = 0
-                while index < start:
-                    next_symbol = self._skip_object()
-                    index += 1
-
-                # Read objects at positions that fall within the slice
-                while index < stop:
-                    # Check if we've reached the end of the list
-                    if next_symbol == ']':
-                        break
-
-                    # Read the object directly without creating a new ObjectProxy
-                    value = self.reader._read_object()
-                    if type(value) is not tuple:
-                        result.append(value)
-                    elif value == self.listEnd and stop == float('inf'):
-                        break
-                    else:
-                        raise IndexError(f"List index {index} out of range, unexpected symbol {value}")
-
-                    # Skip (step-1) objects to get to the next desired position
-                    for _ in range(step - 1):
-                        # Skip and check if we've reached the end of the list
-                        if self._skip_object() == ']':
-                            if stop == float('inf'):
-                                stop = index
-                                break
-                    index += step
-
-                # Result is now complete
+                for position in positions:
+                    self.reader._setPos(position)
+                    result.append(self.reader._read_object())
                 return result
 
             else:
@@ -1915,29 +2691,35 @@ class ObjectProxy:
 
         elif self.symbol == '{':
             # Object is a dictionary - handle key-based lookup
-            # Sequential scan through dictionary entries until we find the matching key
-            while True:
-                key_symbol, key_size, key_shape = self.reader._read_type()
-
-                # Check if we've reached the end of the dictionary without finding the key
-                if key_symbol == '}':
-                    raise KeyError(f"Key {item} not found in dictionary")
-
-                # Read the key and convert lists to tuples if needed (for hashability)
-                key = self.reader._read_element(key_symbol, key_size, key_shape)
-                if isinstance(key, list):
-                    key = self.reader._convert_to_deep_tuple(key)
-
-                if key == item:
-                    # Key found, get the appropriate return value (ObjectProxy or primitive)
-                    return self._get_item_value()
-                else:
-                    # Key doesn't match, skip the value and continue to next key-value pair
-                    self._skip_object()
+            # The keys are scanned on the first accesses, later accesses find the value directly
+            position = self._find_value(item)
+            if position is None:
+                raise KeyError(f"Key {item} not found in dictionary")
+            self.reader._setPos(position)
+
+            # Get the appropriate return value (ObjectProxy or primitive)
+            return self._get_item_value()
 
         elif self.shape and (len(self.shape) > 1 or self.symbol not in 'sxu'):
             # Get the current file position as the data start position
-            data_start_pos = self.xtFile.file.tell()  # Position where the actual array data begins
+            data_start_pos = self.reader._getPos()  # Position where the actual array data begins
+
+            # Index memory-mapped arrays with NumPy instead of reading chunk by chunk.
+            # Only indices other than integers and slices need the preparation
+            mapped = self.reader._mmap
+            if mapped is not None and data_start_pos + self.data_size <= len(mapped):
+                basic = self._is_basic_index(item)
+                if not basic:
+                    self._handle_array_indexing(item)
+                return self._index_mapped_array(mapped, data_start_pos, item, basic)
+
+            # Single elements are read directly, without preparing index arrays
+            if isinstance(item, tuple) and len(item) == len(self.shape) and \
+                    all(type(idx) is int for idx in item) and self._is_basic_index(item):
+                return self._read_array_element(data_start_pos, item)
+            if type(item) is int and len(self.shape) == 1 and self._is_basic_index(item):
+                return self._read_array_element(data_start_pos, (item,))
+
             # Call the helper method for array handling to prepare variables
             dtype, index_arrays, result_shape, chunk_size, strides, element_size = \
                     self._handle_array_indexing(item)
@@ -1946,24 +2728,15 @@ class ObjectProxy:
             if any(len(arr) == 0 for arr in index_arrays):
                 return np.array([], dtype=dtype).reshape(result_shape)
 
-            # Use itertools.product to iterate over all combinations of indices
-            binary_data = []
-            for indices in itertools.product(*index_arrays):
-                # Calculate byte offset for this element using the original element size
-                # The strides are based on dimension counts, not bytes
-                offset = sum(idx * stride * element_size
-                          for idx, stride in zip(indices, strides))
-
-                # Seek to the position of this element and read the data
-                self.xtFile.file.seek(data_start_pos + offset)
-                element_bytes = self.xtFile.file.read(chunk_size)
-
-                # Ensure we read the expected number of bytes - this could fail at EOF or with corrupted files
-                assert len(element_bytes) == chunk_size
-                binary_data.append(element_bytes)
+            # Byte offsets of all combinations of indices, in the order of itertools.product.
+            # The strides are based on dimension counts, not bytes
+            offsets = np.zeros((), dtype=np.int64)
+            for indices, stride in zip(index_arrays, strides):
+                offsets = np.add.outer(offsets, np.asarray(indices, dtype=np.int64) * (stride * element_size))
+            offsets = offsets.ravel() + data_start_pos
 
-            # Combine all binary data into a single buffer
-            binary_buffer = b''.join(binary_data)
+            # Read all chunks into a single buffer
+            binary_buffer = self._read_chunks(offsets, chunk_size, element_size)
 
             # Create numpy array from binary data with the correct shape and dtype
             result = np.frombuffer(binary_buffer, dtype=dtype)
@@ -1972,9 +2745,9 @@ class ObjectProxy:
             if result_shape:  # If we have shape, reshape; otherwise leave as 1D
                 result = result.reshape(result_shape)
 
-            # Correct the endianness if needed
+            # Correct the endianness if needed, the buffer is owned by the result
             if self.reader.need_byteswap:
-                result = result.byteswap()
+                result.byteswap(inplace=True)
             return result
         else:
             # Object is a singular type (int, float, str, etc.) which doesn't support indexing
@@ -2015,7 +2788,7 @@ class ObjectProxy:
             raise TypeError(f"Object of type '{self.symbol}' does not support item assignment")
 
         # Get the current file position as the data start position
-        data_start_pos = self.xtFile.file.tell()  # Position where the actual array data begins
+        data_start_pos = self.reader._getPos()  # Position where the actual array data begins
 
         # Call the helper method for array handling to prepare variables
         dtype, index_arrays, result_shape, chunk_size, strides, element_size = \
@@ -2048,11 +2821,9 @@ class ObjectProxy:
         # Check if we're writing a scalar value (either a single element array or a repeated value)
         is_scalar_assignment = (flat_value.size == 1 or np.isscalar(value))
 
-        # Create a copy of flat_value and apply byteswap if needed
+        # Apply byteswap if needed, flat_value is already a copy of the value
         if self.reader.need_byteswap:
-            # Make a copy and apply numpy's byteswap method
-            flat_value = flat_value.copy()
-            flat_value = flat_value.byteswap()
+            flat_value.byteswap(inplace=True)
 
         # For scalar values, prepare the byte sequence once
         scalar_bytes = None
@@ -2120,6 +2891,9 @@ class ObjectProxy:
             # Write the data
             self.xtFile.file.write(binary_value)
 
+        # The read-ahead buffer may hold the old data
+        self.reader._drop_buffer()
+
     def __iter__(self):
         """
         Enable iteration over an ObjectProxy that points to a list.
@@ -2162,8 +2936,8 @@ class ObjectProxy:
             self.reader._setPos(self._iter_original_pos)
             raise StopIteration
 
-        # Otherwise, read the object and increment index
-        value = ObjectProxy(self.xtFile)()
+        # Otherwise, read the object directly at the reading position and increment index
+        value = self.reader._read_object()
         self._iter_index += 1
 
         # If we're at the end of the list, stop iteration
@@ -2206,6 +2980,202 @@ class ObjectProxy:
             return f"<ObjectProxy type='{type_name}'>"
 
 
+    def _read_chunks(self, offsets: np.ndarray, chunk_size: int, element_size: int):
+        """
+        Read chunks of the same size at the given file positions into one buffer.
+
+        Chunks that follow each other in the file are read together. If the
+        chunks are dense or the runs of chunks are close to each other, and
+        the whole range has at most _MAX_SPAN bytes, it is read at once and
+        the chunks are gathered with NumPy. Otherwise each run of chunks is
+        read on its own, in ascending order of the positions. The reads go directly into the buffer with a
+        positional read where available.
+
+        Args:
+            offsets: File positions of the chunks
+            chunk_size: Size of each chunk in bytes
+            element_size: Size of the array elements, which the offsets are aligned to
+
+        Returns:
+            The chunks in the order of the offsets, as bytearray or NumPy array
+        """
+        file = self.xtFile.file
+        file.flush()  # Positional reads bypass the buffer of the file object
+
+        # Runs are read in ascending order of the positions, the order of the
+        # chunks is restored afterwards
+        order = None
+        positions = offsets
+        if len(offsets) > 1 and (np.diff(offsets) < 0).any():
+            order = np.argsort(offsets, kind='stable')
+            positions = offsets[order]
+
+        # Split the chunks into runs of consecutive positions
+        breaks = (np.flatnonzero(np.diff(positions) != chunk_size) + 1).tolist()
+        first = int(positions[0])
+        span = int(positions[-1]) - first + chunk_size
+        size = len(offsets) * chunk_size
+        if breaks and span <= min(max(4 * size, (len(breaks) + 1) * self._RUN_GAP), self._MAX_SPAN):
+            # Read the whole range and select the elements of all chunks
+            data = self._read_at(first, span)
+            elements = np.frombuffer(data, dtype=f'V{element_size}')
+            indices = ((offsets - first) // element_size)[:, np.newaxis] + np.arange(chunk_size // element_size)
+            return elements[indices]
+
+        if hasattr(os, 'posix_fadvise'):
+            # The runs are read one after the other, let the kernel fetch all of them
+            os.posix_fadvise(file.fileno(), first, span, os.POSIX_FADV_WILLNEED)
+        binary_buffer = bytearray(size)
+        with memoryview(binary_buffer) as view:
+            for start, end in zip([0] + breaks, breaks + [len(offsets)]):
+                self._read_at(int(positions[start]), (end - start) * chunk_size,
+                              view[start * chunk_size:end * chunk_size])
+        if order is None:
+            return binary_buffer
+        chunks = np.empty(len(offsets), dtype=f'V{chunk_size}')
+        chunks[order] = np.frombuffer(binary_buffer, dtype=f'V{chunk_size}')
+        return chunks
+
+    def _read_at(self, pos: int, size: int, buffer: memoryview = None):
+        """
+        Read bytes at a file position without using the file position of the reader.
+
+        Args:
+            pos: The file position
+            size: Number of bytes to read
+            buffer: Optional buffer of the size to read into
+
+        Returns:
+            The buffer, a new bytearray if none was given
+
+        Raises:
+            EOFError: If the file ends before all bytes are read
+        """
+        if buffer is None:
+            buffer = bytearray(size)
+        file = self.xtFile.file
+        if hasattr(os, 'preadv'):
+            n = os.preadv(file.fileno(), [buffer], pos)
+        else:
+            file.seek(pos)
+            n = file.readinto(buffer)
+
+        # Ensure we read the expected number of bytes - this could fail at EOF or with corrupted files
+        if n != size:
+            raise EOFError(f"Unexpected end of file while reading {size} bytes at position {pos}")
+        return buffer
+
+    def _array_dtypes(self) -> Tuple[np.dtype, np.dtype]:
+        """
+        Get the data types of the array elements in the file and in the result.
+
+        Returns:
+            Tuple[np.dtype, np.dtype]: The dtype of the stored bytes, with uint8 for
+            booleans and swapped byte order if needed, and the native NumPy dtype
+        """
+        dtype = np.dtype(self.reader.dtype_map[self.symbol])
+        if dtype == np.bool_:
+            return np.dtype(np.uint8), dtype
+        if self.reader.need_byteswap:
+            return dtype.newbyteorder(), dtype
+        return dtype, dtype
+
+    def _read_array_element(self, data_start_pos: int, item_indices: Tuple[int, ...]) -> np.ndarray:
+        """
+        Read a single array element from the file.
+
+        Args:
+            data_start_pos: The position of the array data in the file
+            item_indices: One valid integer index per dimension
+
+        Returns:
+            np.ndarray: Array with the element
+        """
+        offset = 0
+        for idx, dim_size in zip(item_indices, self.shape):
+            offset = offset * dim_size + idx % dim_size
+        file_dtype, dtype = self._array_dtypes()
+        self.xtFile.file.flush()  # Positional reads bypass the buffer of the file object
+        raw = self._read_at(data_start_pos + offset * file_dtype.itemsize, file_dtype.itemsize)
+        element = np.frombuffer(raw, dtype=file_dtype)
+        if dtype == np.bool_:
+            return element != 0
+        return element.astype(dtype, copy=False)
+
+    def _is_basic_index(self, item: Union[int, slice, List[int], np.ndarray, Tuple]) -> bool:
+        """
+        Check if an array index consists of valid integers and slices only.
+
+        Args:
+            item: The index specifier
+
+        Returns:
+            bool: True if the index can be applied without _handle_array_indexing
+        """
+        if self.symbol not in self.reader.dtype_map:
+            return False
+        item_indices = item if isinstance(item, tuple) else (item,)
+        if len(item_indices) > len(self.shape):
+            return False
+        for idx, dim_size in zip(item_indices, self.shape):
+            if isinstance(idx, int) and not isinstance(idx, bool):
+                if not -dim_size <= idx < dim_size:
+                    return False
+            elif not isinstance(idx, slice):
+                return False
+        return True
+
+    def _index_mapped_array(self, mapped: mmap.mmap, data_start_pos: int,
+                            item: Union[int, slice, List[int], np.ndarray, Tuple],
+                            basic: bool = False) -> np.ndarray:
+        """
+        Select the indexed elements of an array in the memory map of the file.
+
+        The indices are applied to an array view of the map, one dimension after
+        the other, so lists of indices select all their combinations like the
+        chunked reading does. The result is a copy in native byte order that
+        doesn't reference the map, since views of the map would point to unmapped
+        memory once the file is closed. For slices, the copy of the strided view
+        is the only pass over the data. The view is created on the first call and
+        kept for the following ones.
+
+        Args:
+            mapped: The memory map of the file
+            data_start_pos: The position of the array data in the file
+            item: The index specifier, integers and slices or validated by _handle_array_indexing
+            basic: True if the index was checked by _is_basic_index
+
+        Returns:
+            np.ndarray: The selected elements
+        """
+        if self._mapped_view is None or self._mapped_view[0] is not mapped:
+            file_dtype, dtype = self._array_dtypes()
+            array = np.ndarray(self.shape, dtype=file_dtype, buffer=mapped, offset=data_start_pos)
+            self._mapped_view = (mapped, array, dtype)
+        _, array, dtype = self._mapped_view
+
+        if basic:
+            # Integers and slices select the same elements in a single step
+            array = array[item]
+            item = ()
+        axis = 0
+        for idx in (item if isinstance(item, tuple) else (item,)):
+            if isinstance(idx, int):
+                # Booleans are integers here, not masks
+                array = array[(slice(None),) * axis + (int(idx),)]
+                continue
+            if not isinstance(idx, slice):
+                idx = np.array(idx, dtype=np.intp)
+            array = array[(slice(None),) * axis + (idx,)]
+            axis += 1
+
+        if dtype == np.bool_:
+            result = array != 0
+        else:
+            result = np.array(array, dtype=dtype)
+        # Single elements are returned as arrays with one element
+        return result.reshape(-1) if result.ndim == 0 else result
+
     def _handle_array_indexing(self, item: Union[int, slice, List[int], np.ndarray, Tuple]) -> Tuple[np.dtype, List, List[int], int, List[int], int]:
         """
         Prepare variables for array indexing operations.
@@ -2279,26 +3249,30 @@ class ObjectProxy:
                 index_arrays.append((idx,))  # No dimension in result shape (selecting single element)
                 slice_info.append((0, 0, 0))  # Not a slice
             elif isinstance(idx, slice):
-                # Slice: extract indices and create array
+                # Slice: a range of indices, which is not materialized
                 start, stop, step = idx.indices(dim_size)
                 indices = range(start, stop, step)
                 index_arrays.append(indices)
                 result_shape.append(len(indices))  # Add dimension to result shape
                 slice_info.append((step, start, len(indices) if len(indices)!=dim_size else -1))  # Store slice parameters
             elif isinstance(idx, (list, np.ndarray)):
-                # List or numpy array: use directly as indices
-                indices = []
-                for j in idx:
-                    if isinstance(j, int):
-                        if j < 0:
-                            j += dim_size  # Handle negative indexing
-                        if j < 0 or j >= dim_size:
-                            raise IndexError(f"Index {j} out of bounds for dimension {i} with size {dim_size}")
-                        indices.append(j)
-                    else:
-                        raise TypeError(f"Indices must be integers, not {type(j).__name__}")
+                # List or numpy array: validate as an integer array of indices
+                indices = np.asarray(idx)
+                if indices.ndim != 1:
+                    raise TypeError(f"Index arrays must be one-dimensional, not {indices.ndim}-dimensional")
+                # Python bools in a list count as integers, but a boolean
+                # numpy array would be a mask, which is not supported
+                allowed = 'iub' if isinstance(idx, list) else 'iu'
+                if indices.size and indices.dtype.kind not in allowed:
+                    raise TypeError(f"Indices must be integers, not {indices.dtype}")
+                indices = indices.astype(np.intp)
+                indices[indices < 0] += dim_size  # Handle negative indexing
+                out_of_bounds = (indices < 0) | (indices >= dim_size)
+                if out_of_bounds.any():
+                    raise IndexError(f"Index {indices[out_of_bounds][0]} out of bounds for dimension {i} with size {dim_size}")
                 index_arrays.append(indices)
                 result_shape.append(len(indices))  # Add dimension to result shape
+                slice_info.append((0, 0, 0))  # Not a slice
             else:
                 raise TypeError(f"Invalid index type: {type(idx).__name__}")
 
@@ -285,3 +285,154 @@ def test_len_method(temp_file):
         # Test len() raises TypeError for non-container types
         with pytest.raises(TypeError):
             len(xf["dict"]["a"])
+
+def test_buffered_writing(temp_file):
+    """Test writes that exceed the writer's staging buffer."""
+    test_data = {
+        "many_items": [{"id": i, "name": f"item{i}"} for i in range(100_000)],
+        "large_bytes": bytes(range(256)) * 8192,
+        "tail": "end"
+    }
+
+    # Write data to file
+    with xtype.File(temp_file.name, 'w') as xf:
+        xf.write(test_data)
+
+    # Read data back
+    with xtype.File(temp_file.name, 'r') as xf:
+        read_data = xf.read()
+
+    # Compare original and read data
+    assert read_data == test_data
+
+def test_read_data_outlives_file(temp_file):
+    """Test that data read from a file stays valid after the file is closed and overwritten."""
+    test_data = {
+        "array": np.arange(100_000, dtype=np.int64),
+        "text": "x" * 10_000
+    }
+
+    with xtype.File(temp_file.name, 'w') as xf:
+        xf.write(test_data)
+
+    with xtype.File(temp_file.name, 'r') as xf:
+        read_data = xf.read()
+        array_slice = xf["array"][10:20]
+
+    # Truncate the file by writing something else
+    with xtype.File(temp_file.name, 'w') as xf:
+        xf.write(1)
+
+    np.testing.assert_array_equal(read_data["array"], test_data["array"])
+    np.testing.assert_array_equal(array_slice, test_data["array"][10:20])
+    assert read_data["text"] == test_data["text"]
+
+def test_skip_footnotes(temp_file):
+    """Test skipping values that are preceded by footnotes."""
+    # Footnotes are not written by the library, so the file is composed manually
+    data = (b'{1sa*1sc*[k' + struct.pack('<i', 3) + b']k' + struct.pack('<i', 1) +
+            b'1sb*[*T]k' + struct.pack('<i', 2) +
+            b'1sd[*T*1sq[]F]}')
+    with open(temp_file.name, 'wb') as f:
+        f.write(data)
+
+    with xtype.File(temp_file.name, 'r', byteorder='little') as xf:
+        assert xf.keys() == ['a', 'b', 'd']
+        assert len(xf) == 3
+        assert len(xf["d"]) == 2
+        assert xf["d"][1] is False
+
+def test_skip_unterminated_containers(temp_file):
+    """Test skipping items of lists that are closed by the end of the file."""
+    # The end of the file closes all open containers, also within an item
+    for data, expected in ((b'[I\x05I\x06[I\x01', [5, 6, [1]]),
+                           (b'[I\x05I\x06{1sa1sb', [5, 6, {'a': 'b'}]),
+                           (b'[I\x05[[I\x01', [5, [[1]]])):
+        with open(temp_file.name, 'wb') as f:
+            f.write(data)
+
+        # Mode 'r' skips in the memory map, mode 'a' through the grammar parser
+        for mode in ('r', 'a'):
+            with xtype.File(temp_file.name, mode, byteorder='little') as xf:
+                assert xf.read() == expected
+                assert len(xf.root) == len(expected)
+                assert xf.root[len(expected) - 1]() == expected[-1]
+                assert xf.root[1:] == expected[1:]
+
+                # Length, negative indexes and iteration agree on the recorded positions
+                lst = xf.root
+                items = list(lst)
+                assert len(lst) == len(items)
+                last = lst[-1]
+                assert last() == expected[-1]
+                assert items[-1] == expected[-1]
+                assert lst[-len(expected)] == expected[0]
+
+    # A length cut off by the end of the file cannot be skipped
+    with open(temp_file.name, 'wb') as f:
+        f.write(b'[I\x05N\x01')
+
+    for mode in ('r', 'a'):
+        with xtype.File(temp_file.name, mode, byteorder='little') as xf:
+            with pytest.raises(ValueError, match="Unexpected end of file when reading length of type N"):
+                len(xf.root)
+
+def test_read_truncated_files(temp_file):
+    """Test that files cut off within an element report the end of the file."""
+    for data in (b'*j\xd2\x04[I\x05k\x01\x00', b'*j\xd2\x04{1sa3sab', b'*j\xd2\x04[M'):
+        with open(temp_file.name, 'wb') as f:
+            f.write(data)
+
+        # Mode 'r' reads from the memory map, mode 'a' from the file
+        for mode in ('r', 'a'):
+            with xtype.File(temp_file.name, mode) as xf:
+                with pytest.raises(ValueError, match="Unexpected end of file"):
+                    xf.read()
+
+def test_list_skipping_modes(temp_file):
+    """Test list length, indexing and slicing of memory-mapped and regularly read files."""
+    test_data = {
+        "list": [[i, "abc", {"x": 1.5, "y": [1, 2]}] for i in range(1000)],
+        "empty": [],
+        "after": "tail"
+    }
+
+    with xtype.File(temp_file.name, 'w') as xf:
+        xf.write(test_data)
+
+    # Mode 'r' skips in the memory map, mode 'a' through the grammar parser
+    for mode in ('r', 'a'):
+        with xtype.File(temp_file.name, mode) as xf:
+            assert len(xf.root["list"]) == 1000
+            assert len(xf.root["empty"]) == 0
+            assert xf.root["list"][999][0] == 999
+            assert xf.root["list"][995:][0][0] == 995
+            assert xf.root["empty"][2:] == []
+            with pytest.raises(IndexError):
+                xf.root["list"][1000]
+
+            # Repeated access to the same list uses the recorded item positions
+            lst = xf.root["list"]
+            assert [lst[i][0] for i in (500, 3, 999, 500)] == [500, 3, 999, 500]
+            assert lst[-1][0] == 999
+            assert [item[0] for item in lst[10:20:5]] == [10, 15]
+            with pytest.raises(IndexError):
+                lst[998:1002]
+
+def test_dict_lookup_positions(temp_file):
+    """Test repeated key lookups, which use the recorded positions of the values."""
+    test_data = {f"key{i}": {"id": i, "values": [i, i + 1]} for i in range(1000)}
+
+    with xtype.File(temp_file.name, 'w') as xf:
+        xf.write(test_data)
+
+    for mode in ('r', 'a'):
+        with xtype.File(temp_file.name, mode) as xf:
+            assert xf.root["key500"]["id"] == 500
+            assert xf.root["key3"]["values"]() == [3, 4]
+            assert xf.root["key999"]["id"] == 999
+            assert xf.root["key500"]["id"] == 500
+            assert xf.root.keys() == list(test_data.keys())
+            assert len(xf.root) == 1000
+            with pytest.raises(KeyError):
+                xf.root["missing"]
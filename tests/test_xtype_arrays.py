@@ -70,6 +70,23 @@ def test_1d_arrays(temp_file):
         np.testing.assert_array_equal(read_data[key], value)
         assert read_data[key].dtype == value.dtype
 
+def test_bool_array_values(temp_file):
+    """Test that boolean arrays are read back as normalized 0/1 bytes."""
+    bool_array = np.array([[True, False, True], [False, False, True]])
+
+    with xtype.File(temp_file.name, 'w') as xf:
+        xf.write(bool_array)
+
+    # The file stores True as 0xFF
+    with open(temp_file.name, 'rb') as f:
+        assert f.read()[-6:] == b'\xff\x00\xff\x00\x00\xff'
+
+    with xtype.File(temp_file.name, 'r') as xf:
+        read_array = xf.read()
+
+    assert read_array.dtype == np.bool_
+    np.testing.assert_array_equal(read_array.view(np.uint8), bool_array.view(np.uint8))
+
 def test_2d_arrays(temp_file):
     """Test serializing and deserializing 2D NumPy arrays."""
     test_data = {
@@ -113,6 +130,54 @@ def test_multidimensional_arrays(temp_file):
         assert read_data[key].dtype == value.dtype
         assert read_data[key].shape == value.shape
 
+def test_non_contiguous_arrays(temp_file):
+    """Test serializing arrays that are not C-contiguous or larger than one write block."""
+    base = np.arange(400000, dtype=np.int32).reshape(800, 500)
+    test_data = {
+        "transposed": base.T,
+        "strided": base[::3, ::-2],
+        "fortran_float": np.asfortranarray(base.astype(np.float64)),
+        "bool_transposed": (base % 3 == 0).T,
+        "string_transposed": np.array([[b"ab", b"c"], [b"x", b"yz"]] * 1000).T
+    }
+
+    for byteorder in ('little', 'big'):
+        # Write data to file
+        with xtype.File(temp_file.name, 'w', byteorder=byteorder) as xf:
+            xf.write(test_data)
+
+        # Read data back
+        with xtype.File(temp_file.name, 'r') as xf:
+            read_data = xf.read()
+
+        # Compare original and read data
+        for key, value in test_data.items():
+            np.testing.assert_array_equal(read_data[key], value)
+            assert read_data[key].shape == value.shape
+
+def test_non_native_byteorder_arrays(temp_file):
+    """Test serializing arrays with an explicit byte order in their dtype."""
+    test_data = {
+        "big_int32": np.arange(-50, 50, dtype='>i4'),
+        "little_uint16": np.arange(100, dtype='<u2').reshape(10, 10),
+        "big_float64": np.linspace(0, 1, 30, dtype='>f8')[::2],
+        "little_float16": np.array([1.5, -2.25, np.inf], dtype='<f2')
+    }
+
+    for byteorder in ('little', 'big'):
+        # Write data to file
+        with xtype.File(temp_file.name, 'w', byteorder=byteorder) as xf:
+            xf.write(test_data)
+
+        # Read data back
+        with xtype.File(temp_file.name, 'r') as xf:
+            read_data = xf.read()
+
+        # Compare original and read data
+        for key, value in test_data.items():
+            np.testing.assert_array_equal(read_data[key], value)
+            assert read_data[key].dtype.str[1:] == value.dtype.str[1:]
+
 def test_string_arrays(temp_file):
     """Test serializing and deserializing string arrays."""
     test_data = {
@@ -178,6 +243,68 @@ def test_array_indexing(temp_file):
         np.testing.assert_array_equal(xf["array_4d"][0:2, 1, [0, 2]], array_4d[0:2, 1, [0, 2]])
         np.testing.assert_array_equal(xf["array_4d"][[1], :2, 0], array_4d[[1], :2, 0])
 
+def test_array_indexing_modes(temp_file):
+    """Test array indexing of memory-mapped and regularly read files in both byte orders."""
+    array_3d = np.arange(60, dtype=np.int16).reshape(4, 5, 3)
+
+    for byteorder in ('little', 'big'):
+        with xtype.File(temp_file.name, 'w', byteorder=byteorder) as xf:
+            xf.write({"array_3d": array_3d})
+
+        # Mode 'r' indexes the memory map, mode 'a' reads the elements from the file
+        for mode in ('r', 'a'):
+            with xtype.File(temp_file.name, mode) as xf:
+                np.testing.assert_array_equal(xf["array_3d"][1, 2, 0], [array_3d[1, 2, 0]])
+                np.testing.assert_array_equal(xf["array_3d"][-1, 0, -2], [array_3d[-1, 0, -2]])
+                np.testing.assert_array_equal(xf["array_3d"][:, [0, 2]], array_3d[:, [0, 2]])
+                np.testing.assert_array_equal(xf["array_3d"][::2, :, [-1]], array_3d[::2, :, [-1]])
+                np.testing.assert_array_equal(xf["array_3d"][[3, 0], 1:4], array_3d[[3, 0], 1:4])
+                np.testing.assert_array_equal(xf["array_3d"][[0, 2], [1, 3]], array_3d[[0, 2]][:, [1, 3]])
+                np.testing.assert_array_equal(xf["array_3d"][np.array([3, -4]), 0], array_3d[[3, 0], 0])
+                assert xf["array_3d"][-1].dtype == np.int16
+                with pytest.raises(TypeError):
+                    xf["array_3d"][np.array([True, False, True, False])]
+
+def test_array_slices_after_close(temp_file):
+    """Test that sliced arrays of memory-mapped files stay valid after closing the file."""
+    array_2d = np.arange(200, dtype=np.float64).reshape(10, 20)
+    with xtype.File(temp_file.name, 'w') as xf:
+        xf.write({"array_2d": array_2d})
+
+    with xtype.File(temp_file.name, 'r') as xf:
+        rows = xf["array_2d"][2:8:2]
+        block = xf["array_2d"][1:3, 5:15]
+
+    np.testing.assert_array_equal(rows, array_2d[2:8:2])
+    np.testing.assert_array_equal(block, array_2d[1:3, 5:15])
+    block[0, 0] = -1
+    assert block[0, 0] == -1
+
+def test_array_chunk_read_span(temp_file, monkeypatch):
+    """Test that strided selections wider than _MAX_SPAN are read run by run."""
+    array_1d = np.arange(100000, dtype=np.int32)
+    with xtype.File(temp_file.name, 'w') as xf:
+        xf.write({"array_1d": array_1d})
+
+    # Record the sizes of the positional reads of the chunks
+    read_sizes = []
+    read_at = xtype.ObjectProxy._read_at
+    def recording_read_at(self, pos, size, buffer=None):
+        read_sizes.append(size)
+        return read_at(self, pos, size, buffer)
+    monkeypatch.setattr(xtype.ObjectProxy, '_read_at', recording_read_at)
+
+    # The range of the selection is dense enough to be read at once, unless it
+    # exceeds the largest range read at once
+    monkeypatch.setattr(xtype.ObjectProxy, '_MAX_SPAN', 1 << 16)
+    with xtype.File(temp_file.name, 'a') as xf:
+        np.testing.assert_array_equal(xf["array_1d"][::3], array_1d[::3])
+        assert read_sizes and max(read_sizes) <= 1 << 16
+
+        read_sizes.clear()
+        np.testing.assert_array_equal(xf["array_1d"][:10000:3], array_1d[:10000:3])
+        assert len(read_sizes) == 1
+
 def test_array_edge_cases(temp_file):
     """Test edge cases of array indexing."""
     # Create test data
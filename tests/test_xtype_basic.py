@@ -148,6 +148,14 @@ def test_error_cases(temp_file):
         with pytest.raises(TypeError):
             xf["key1"][0]()
 
+def test_write_unsupported_type(temp_file):
+    """Test that a failed write leaves nothing of the object in the file."""
+    with xtype.File(temp_file.name, 'w') as xf:
+        with pytest.raises(TypeError):
+            xf.write([1, 2, object()])
+
+    assert os.path.getsize(temp_file.name) == 0
+
 def test_file_modes(temp_file):
     """Test file opening in different modes."""
     # Test write mode
@@ -162,3 +170,42 @@ def test_file_modes(temp_file):
     with pytest.raises(ValueError):
         with xtype.File(temp_file.name, 'x') as xf:
             pass
+
+def test_long_integer_lists(temp_file):
+    """Test long lists of integers that cover all integer type codes."""
+    test_data = [
+        list(range(-1000, 1000, 3)),
+        [0, 255, 256, 65535, 65536, 2**32 - 1, 2**32, 2**63 - 1] * 8,
+        [-1, -128, -129, -32768, -32769, -2**31, -2**31 - 1, -2**63] * 8,
+        [2**64 - 1, 2**63, 0, 1] * 10,
+        [2**64 - 1, -1] * 20,
+    ]
+
+    for byteorder in ('little', 'big'):
+        # Write data to file
+        with xtype.File(temp_file.name, 'w', byteorder=byteorder) as xf:
+            xf.write(test_data)
+
+        # Read data back
+        with xtype.File(temp_file.name, 'r') as xf:
+            read_data = xf.read()
+
+        # Compare original and read data
+        assert read_data == test_data
+
+def test_long_float_lists(temp_file):
+    """Test long lists of floats, which are written as consecutive double elements."""
+    test_data = [
+        [i / 7 for i in range(-500, 500)],
+        [0.0, -0.0, 1e-300, -1e300, float('inf'), float('-inf')] * 8,
+    ]
+
+    for byteorder in ('little', 'big'):
+        with xtype.File(temp_file.name, 'w', byteorder=byteorder) as xf:
+            xf.write(test_data)
+
+        with xtype.File(temp_file.name, 'r') as xf:
+            read_data = xf.read()
+            assert xf[1][1] == 0.0 and str(xf[1][1]) == '-0.0'
+
+        assert read_data == test_data